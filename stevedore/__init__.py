@@ -1,9 +1,12 @@
 """Core package for the Stevedore Prefect project."""
 
 # Re-export commonly used modules to provide a stable public interface for
-# flows and tasks when running inside Prefect workers.
+# flows and tasks when running inside Prefect workers. Subpackages are imported
+# lazily on first attribute access so workers only pay for what they use.
 
-from . import blocks, cli, deployments, flows, tasks  # noqa: F401
+import importlib
+
+_LAZY_SUBMODULES = {"blocks", "cli", "deployments", "flows", "tasks"}
 
 __all__ = [
     "blocks",
@@ -14,3 +17,13 @@ __all__ = [
 ]
 
 
+def __getattr__(name: str):
+    if name in _LAZY_SUBMODULES:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | _LAZY_SUBMODULES)
@@ -1,10 +1,13 @@
 """Prefect block definitions for the stevedore project."""
 
 from .cobalt import CobaltSettings  # noqa: F401
+from .loading import load_block, warm_block  # noqa: F401
 from .minio import MinIOBucket  # noqa: F401
 
 __all__ = [
     "CobaltSettings",
     "MinIOBucket",
+    "load_block",
+    "warm_block",
 ]
 
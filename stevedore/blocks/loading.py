@@ -0,0 +1,60 @@
+"""Per-event-loop reuse of loaded Prefect blocks."""
+
+from __future__ import annotations
+
+import asyncio
+import weakref
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, TypeVar
+
+from prefect.blocks.core import Block
+
+BlockT = TypeVar("BlockT", bound=Block)
+
+# Loaded blocks per event loop, keyed by block type and name, so flows and the
+# tasks they run read each block from the Prefect API only once per process.
+# Entries hold the load future, so concurrent callers share a single request.
+_BLOCKS: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[type, str], asyncio.Future]
+] = weakref.WeakKeyDictionary()
+
+
+async def load_block(block_type: type[BlockT], name: str) -> BlockT:
+    """Load the ``block_type`` block called ``name``, reusing earlier loads."""
+
+    blocks = _BLOCKS.setdefault(asyncio.get_running_loop(), {})
+    key = (block_type, name)
+    future = blocks.get(key)
+    if future is None:
+        future = blocks[key] = asyncio.ensure_future(block_type.load(name))
+
+    try:
+        return await asyncio.shield(future)
+    except Exception:
+        if blocks.get(key) is future:
+            del blocks[key]
+        raise
+
+
+@asynccontextmanager
+async def warm_block(block_type: type[Block], name: str) -> AsyncIterator[None]:
+    """Load a block and run its ``warmup()`` in the background within the context.
+
+    The loaded instance lands in the ``load_block`` cache, so work inside the
+    context reuses it. A warmup still running on exit is cancelled, and warmup
+    failures are ignored since they are retried by the first real use.
+    """
+
+    async def warm() -> None:
+        block = await load_block(block_type, name)
+        await block.warmup()
+
+    warmup = asyncio.ensure_future(warm())
+    try:
+        yield
+    finally:
+        warmup.cancel()
+        await asyncio.gather(warmup, return_exceptions=True)
+
+
+__all__ = ["load_block", "warm_block"]
@@ -2,9 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+import asyncio
+import os
+from typing import Any, AsyncIterable, Iterable, Optional
 
-from pydantic import Field
+from pydantic import Field, PrivateAttr
 
 from prefect.blocks.core import Block
 from prefect_aws.s3 import S3Bucket
@@ -32,10 +34,46 @@ class MinIOBucket(Block):
         example="/",
     )
 
+    _cached_bucket: Optional[S3Bucket] = PrivateAttr(default=None)
+    _cached_client: Any = PrivateAttr(default=None)
+    _bucket_lock: Optional[asyncio.Lock] = PrivateAttr(default=None)
+
     async def load_bucket(self) -> S3Bucket:
-        """Load the configured S3Bucket block instance."""
+        """Load the configured S3Bucket block instance.
+
+        The block is fetched from the Prefect API once per ``MinIOBucket``
+        instance and reused by subsequent calls.
+        """
+
+        if self._cached_bucket is None:
+            if self._bucket_lock is None:
+                self._bucket_lock = asyncio.Lock()
+            async with self._bucket_lock:
+                if self._cached_bucket is None:
+                    self._cached_bucket = await S3Bucket.load(self.bucket_block_name)
+
+        return self._cached_bucket
+
+    def _get_s3_client(self, bucket: S3Bucket) -> Any:
+        """Return the boto client for ``bucket``, reusing it for the cached bucket."""
 
-        return await S3Bucket.load(self.bucket_block_name)
+        if bucket is not self._cached_bucket:
+            return bucket._get_s3_client()
+
+        if self._cached_client is None:
+            self._cached_client = bucket._get_s3_client()
+        return self._cached_client
+
+    async def warmup(self) -> None:
+        """Load the bucket and open a connection to its endpoint ahead of use.
+
+        Issues a cheap ``head_bucket`` so the first object operations of a flow
+        do not queue behind connection setup.
+        """
+
+        bucket = await self.load_bucket()
+        client = self._get_s3_client(bucket)
+        await run_sync_in_worker_thread(client.head_bucket, Bucket=bucket.bucket_name)
 
     async def head_object(
         self,
@@ -47,7 +85,7 @@ class MinIOBucket(Block):
 
         bucket = bucket or await self.load_bucket()
         resolved_key = bucket._resolve_path(key)
-        client = bucket._get_s3_client()
+        client = self._get_s3_client(bucket)
 
         return await run_sync_in_worker_thread(
             client.head_object,
@@ -55,19 +93,238 @@ class MinIOBucket(Block):
             Key=resolved_key,
         )
 
+    async def read_range(
+        self,
+        key: str,
+        byte_range: str,
+        *,
+        bucket: Optional[S3Bucket] = None,
+    ) -> bytes:
+        """Return the bytes of an object selected by an HTTP ``Range`` value."""
+
+        bucket = bucket or await self.load_bucket()
+        resolved_key = bucket._resolve_path(key)
+        client = self._get_s3_client(bucket)
+
+        def read() -> bytes:
+            response = client.get_object(
+                Bucket=bucket.bucket_name,
+                Key=resolved_key,
+                Range=byte_range,
+            )
+            return response["Body"].read()
+
+        return await run_sync_in_worker_thread(read)
+
+    async def replace_metadata(
+        self,
+        key: str,
+        metadata: dict[str, str],
+        *,
+        bucket: Optional[S3Bucket] = None,
+    ) -> dict[str, Any]:
+        """Replace the user metadata of an object with a server-side self-copy."""
+
+        bucket = bucket or await self.load_bucket()
+        resolved_key = bucket._resolve_path(key)
+        client = self._get_s3_client(bucket)
+
+        return await run_sync_in_worker_thread(
+            client.copy_object,
+            Bucket=bucket.bucket_name,
+            Key=resolved_key,
+            CopySource={"Bucket": bucket.bucket_name, "Key": resolved_key},
+            Metadata=metadata,
+            MetadataDirective="REPLACE",
+        )
+
+    async def presigned_url(
+        self,
+        key: str,
+        *,
+        bucket: Optional[S3Bucket] = None,
+        expires_in: int = 3600,
+    ) -> str:
+        """Return a presigned GET URL for the given object key."""
+
+        bucket = bucket or await self.load_bucket()
+        client = self._get_s3_client(bucket)
+
+        return client.generate_presigned_url(
+            "get_object",
+            Params={"Bucket": bucket.bucket_name, "Key": bucket._resolve_path(key)},
+            ExpiresIn=expires_in,
+        )
+
+    async def upload_stream(
+        self,
+        key: str,
+        chunks: AsyncIterable[bytes],
+        *,
+        bucket: Optional[S3Bucket] = None,
+        part_size: int = 8 * 1024 * 1024,
+        max_concurrency: int = 4,
+    ) -> str:
+        """Upload an async byte stream as a multipart object and return its key.
+
+        Parts are uploaded while the stream is still being consumed, with at most
+        ``max_concurrency`` part uploads in flight. The upload is aborted if the
+        stream or any part fails, or if the upload is cancelled.
+        """
+
+        bucket = bucket or await self.load_bucket()
+        client = self._get_s3_client(bucket)
+        resolved_key = bucket._resolve_path(key)
+        target = {"Bucket": bucket.bucket_name, "Key": resolved_key}
+
+        upload = await run_sync_in_worker_thread(client.create_multipart_upload, **target)
+        upload_id = upload["UploadId"]
+
+        semaphore = asyncio.Semaphore(max_concurrency)
+        pending: list[asyncio.Task] = []
+        failures: list[Exception] = []
+
+        async def upload_part(part_number: int, body: bytes) -> dict[str, Any]:
+            try:
+                response = await run_sync_in_worker_thread(
+                    client.upload_part,
+                    UploadId=upload_id,
+                    PartNumber=part_number,
+                    Body=body,
+                    **target,
+                )
+            except Exception as exc:
+                failures.append(exc)
+                raise
+            finally:
+                semaphore.release()
+            return {"PartNumber": part_number, "ETag": response["ETag"]}
+
+        async def submit(body: bytes) -> None:
+            await semaphore.acquire()
+            # Fail fast: surface a part that already failed instead of reading
+            # the rest of the stream before the final gather.
+            if failures:
+                raise failures[0]
+            pending.append(asyncio.ensure_future(upload_part(len(pending) + 1, body)))
+
+        try:
+            # Chunks are held as-is and joined once per part, so a chunk that is
+            # exactly one part long is uploaded without being copied.
+            buffered: list[bytes] = []
+            buffered_size = 0
+            async for chunk in chunks:
+                if not chunk:
+                    continue
+                buffered.append(chunk)
+                buffered_size += len(chunk)
+                while buffered_size >= part_size:
+                    joined = buffered[0] if len(buffered) == 1 else b"".join(buffered)
+                    if len(joined) == part_size:
+                        await submit(joined)
+                        buffered, buffered_size = [], 0
+                    else:
+                        await submit(joined[:part_size])
+                        remainder = joined[part_size:]
+                        buffered, buffered_size = [remainder], len(remainder)
+
+            if buffered or not pending:
+                await submit(b"".join(buffered))
+
+            parts = await asyncio.gather(*pending)
+            await run_sync_in_worker_thread(
+                client.complete_multipart_upload,
+                UploadId=upload_id,
+                MultipartUpload={"Parts": list(parts)},
+                **target,
+            )
+        except BaseException:
+            # Also abort on cancellation so no incomplete upload is left behind.
+            for part in pending:
+                part.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+            await run_sync_in_worker_thread(
+                client.abort_multipart_upload,
+                UploadId=upload_id,
+                **target,
+            )
+            raise
+
+        return resolved_key
+
     async def object_exists(self, key: str, *, bucket: Optional[S3Bucket] = None) -> bool:
         """Return True if the object exists in the configured bucket."""
 
         try:
             await self.head_object(key, bucket=bucket)
         except ClientError as exc:
-            error_code = exc.response.get("Error", {}).get("Code") if hasattr(exc, "response") else None
-            if error_code in {"404", "NoSuchKey"}:
+            if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
                 return False
             raise
 
         return True
 
+    async def objects_exist(
+        self,
+        keys: Iterable[str],
+        *,
+        bucket: Optional[S3Bucket] = None,
+    ) -> dict[str, bool]:
+        """Return a mapping of each key to whether it exists in the bucket.
+
+        Keys are grouped by parent prefix. Each group of two or more keys is
+        answered by one ``list_objects_v2`` scan bounded to the range between its
+        smallest and largest key; lone keys fall back to a HEAD. Groups are
+        checked concurrently.
+        """
+
+        keys = list(dict.fromkeys(keys))
+        bucket = bucket or await self.load_bucket()
+
+        groups: dict[str, dict[str, str]] = {}
+        for key in keys:
+            resolved_key = bucket._resolve_path(key)
+            parent = resolved_key.rpartition("/")[0]
+            groups.setdefault(parent, {})[resolved_key] = key
+
+        async def check(group: dict[str, str]) -> dict[str, bool]:
+            if len(group) == 1:
+                [key] = group.values()
+                return {key: await self.object_exists(key, bucket=bucket)}
+
+            seen = await run_sync_in_worker_thread(
+                self._list_key_range, bucket, sorted(group)
+            )
+            return {key: resolved_key in seen for resolved_key, key in group.items()}
+
+        results: dict[str, bool] = {}
+        for found in await asyncio.gather(*(check(group) for group in groups.values())):
+            results.update(found)
+        return {key: results[key] for key in keys}
+
+    def _list_key_range(self, bucket: S3Bucket, sorted_keys: list[str]) -> set[str]:
+        """List the objects between the first and last of ``sorted_keys``."""
+
+        client = self._get_s3_client(bucket)
+        first, last = sorted_keys[0], sorted_keys[-1]
+        # ``StartAfter`` is exclusive; the first key minus its last character
+        # sorts immediately before it.
+        params = {
+            "Bucket": bucket.bucket_name,
+            "Prefix": os.path.commonprefix([first, last]),
+        }
+        if first[:-1]:
+            params["StartAfter"] = first[:-1]
+
+        seen: set[str] = set()
+        while True:
+            page = client.list_objects_v2(**params)
+            contents = page.get("Contents", [])
+            seen.update(item["Key"] for item in contents)
+            if not page.get("IsTruncated") or (contents and contents[-1]["Key"] >= last):
+                return seen
+            params["ContinuationToken"] = page["NextContinuationToken"]
+
 
 __all__ = ["MinIOBucket"]
 
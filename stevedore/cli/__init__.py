@@ -7,12 +7,8 @@ from typing import Iterable
 
 import typer
 
-from stevedore.cli.operations import (
-    apply_deployments,
-    ensure_work_pool,
-    load_env_file,
-    register_blocks,
-)
+# Operations pull in Prefect, prefect-aws and the deployment modules, so they are
+# imported inside each command to keep ``--help`` and argument parsing fast.
 
 app = typer.Typer(help="Stevedore maintenance CLI")
 
@@ -29,6 +25,8 @@ def create_work_pool(
 ) -> None:
     """Ensure that a Prefect work pool exists with the requested configuration."""
 
+    from stevedore.cli.operations import ensure_work_pool
+
     ensure_work_pool(name, pool_type, overwrite=overwrite)
 
 
@@ -42,6 +40,8 @@ def register_blocks_command(
 ) -> None:
     """Persist the local Prefect blocks needed for development."""
 
+    from stevedore.cli.operations import load_env_file, register_blocks
+
     if env_file:
         load_env_file(env_file)
     register_blocks()
@@ -57,6 +57,8 @@ def apply_deployments_command(
 ) -> None:
     """Register Prefect deployments defined within the repository."""
 
+    from stevedore.cli.operations import apply_deployments, load_env_file
+
     if env_file:
         load_env_file(env_file)
     apply_deployments()
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import os
-import subprocess
 from pathlib import Path
 
 from urllib.parse import urlparse
 
+import anyio
 from botocore.exceptions import ClientError
 
 from stevedore.blocks import CobaltSettings, MinIOBucket
@@ -15,6 +16,10 @@ from stevedore.deployments.local_download_worker import deploy as deploy_local_d
 from stevedore.deployments.local_audio_worker import deploy as deploy_local_audio
 from stevedore.deployments.local_pipeline import deploy as deploy_local_pipeline
 
+from prefect.client.orchestration import get_client
+from prefect.client.schemas.actions import WorkPoolCreate
+from prefect.exceptions import ObjectAlreadyExists
+from prefect.workers.utilities import get_default_base_job_template_for_infrastructure_type
 from prefect_aws.credentials import AwsClientParameters, AwsCredentials
 from prefect_aws.s3 import S3Bucket
 from dotenv import load_dotenv
@@ -32,41 +37,39 @@ def load_env_file(path: Path) -> None:
 def ensure_work_pool(name: str, pool_type: str, overwrite: bool = False) -> None:
     """Ensure a Prefect work pool with the given configuration exists."""
 
-    command = [
-        "prefect",
-        "work-pool",
-        "create",
-        name,
-        "--type",
-        pool_type,
-    ]
+    anyio.run(_ensure_work_pool, name, pool_type, overwrite)
 
-    if overwrite:
-        command.append("--overwrite")
 
-    result = subprocess.run(command, check=False, capture_output=True, text=True)
+async def _ensure_work_pool(name: str, pool_type: str, overwrite: bool) -> None:
+    base_job_template = await get_default_base_job_template_for_infrastructure_type(
+        pool_type
+    )
+    if base_job_template is None:
+        raise ValueError(f"Unknown work pool type '{pool_type}'.")
 
-    if result.returncode == 0:
-        if result.stdout:
-            print(result.stdout.strip())
-        return
+    work_pool = WorkPoolCreate(
+        name=name,
+        type=pool_type,
+        base_job_template=base_job_template,
+    )
 
-    stderr = result.stderr.strip()
-    if "already exists" in stderr and not overwrite:
-        print(f"Work pool '{name}' already exists. Use --overwrite to update.")
-        return
+    async with get_client() as client:
+        try:
+            await client.create_work_pool(work_pool, overwrite=overwrite)
+        except ObjectAlreadyExists:
+            print(f"Work pool '{name}' already exists. Use --overwrite to update.")
+            return
 
-    raise subprocess.CalledProcessError(
-        result.returncode,
-        command,
-        output=result.stdout,
-        stderr=result.stderr,
-    )
+    print(f"Work pool '{name}' ({pool_type}) is ready.")
 
 
 def register_blocks() -> None:
     """Persist local development Prefect blocks."""
 
+    anyio.run(_register_blocks)
+
+
+async def _register_blocks() -> None:
     cobalt_base_url = os.environ["COBALT_BASE_URL"]
 
     minio_endpoint = os.environ["MINIO_ENDPOINT"]
@@ -75,12 +78,14 @@ def register_blocks() -> None:
     minio_secret_key = os.environ["MINIO_SECRET_KEY"]
     minio_path_prefix = os.getenv("MINIO_PATH_PREFIX")
 
-    cobalt_settings = CobaltSettings(
+    # Our own blocks are built from trusted values with plain field types, so
+    # validation is skipped; the prefect-aws blocks below still need it to
+    # coerce secrets and client parameters.
+    cobalt_settings = CobaltSettings.model_construct(
         base_url=cobalt_base_url,
         request_timeout_seconds=30,
         download_timeout_seconds=1800,
     )
-    cobalt_settings.save("local-cobalt", overwrite=True)
 
     endpoint_parsed = urlparse(minio_endpoint)
     use_ssl = endpoint_parsed.scheme == "https"
@@ -88,6 +93,10 @@ def register_blocks() -> None:
         endpoint_url=minio_endpoint,
         use_ssl=use_ssl,
         verify=use_ssl,
+        config={
+            "max_pool_connections": 64,
+            "retries": {"max_attempts": 3, "mode": "adaptive"},
+        },
     )
 
     aws_credentials = AwsCredentials(
@@ -96,12 +105,6 @@ def register_blocks() -> None:
         region_name="us-east-1",
         aws_client_parameters=aws_client_parameters,
     )
-    aws_credentials.save("minio-local-creds", overwrite=True)
-
-    _ensure_bucket_exists(
-        aws_credentials=aws_credentials,
-        bucket_name=minio_bucket_name,
-    )
 
     s3_bucket = S3Bucket(
         bucket_name=minio_bucket_name,
@@ -109,13 +112,26 @@ def register_blocks() -> None:
         endpoint_url=minio_endpoint,
         aws_region="us-east-1",
     )
-    s3_bucket.save("minio-local-bucket", overwrite=True)
 
-    minio_bucket = MinIOBucket(
+    minio_bucket = MinIOBucket.model_construct(
         bucket_block_name="minio-local-bucket",
         bucket_path_prefix=minio_path_prefix,
     )
-    minio_bucket.save("local-minio-assets", overwrite=True)
+
+    # Only the S3Bucket save depends on another block (it references the saved
+    # credentials document), so everything else is written concurrently.
+    async with get_client() as client:
+        await asyncio.gather(
+            cobalt_settings.save("local-cobalt", overwrite=True, client=client),
+            aws_credentials.save("minio-local-creds", overwrite=True, client=client),
+            minio_bucket.save("local-minio-assets", overwrite=True, client=client),
+            asyncio.to_thread(
+                _ensure_bucket_exists,
+                aws_credentials=aws_credentials,
+                bucket_name=minio_bucket_name,
+            ),
+        )
+        await s3_bucket.save("minio-local-bucket", overwrite=True, client=client)
 
     print("Registered Prefect blocks:")
     print("  - CobaltSettings: local-cobalt")
@@ -2,28 +2,68 @@
 
 from __future__ import annotations
 
+import asyncio
+import functools
 from pathlib import Path
 
 import yaml
 
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:  # pragma: no cover - libyaml bindings unavailable
+    from yaml import SafeLoader as _YamlLoader
+
 from prefect.deployments.runner import RunnerDeployment
-from prefect.flows import load_flow_from_entrypoint
+from prefect.flows import Flow, load_flow_from_entrypoint
+
+# Parsed deployment manifests keyed by path; entries are reused until the file's
+# mtime changes so repeated ``deploy()`` calls skip re-parsing.
+_YAML_CACHE: dict[Path, tuple[int, dict]] = {}
+
+
+def _load_manifest(yaml_path: Path) -> dict:
+    mtime_ns = yaml_path.stat().st_mtime_ns
+    cached = _YAML_CACHE.get(yaml_path)
+    if cached and cached[0] == mtime_ns:
+        return cached[1]
+
+    with yaml_path.open("rb") as fh:
+        data = yaml.load(fh, Loader=_YamlLoader) or {}
+
+    _YAML_CACHE[yaml_path] = (mtime_ns, data)
+    return data
 
 
 def deploy() -> None:
     yaml_path = Path(__file__).with_suffix(".yaml")
-    with yaml_path.open("r", encoding="utf-8") as fh:
-        data = yaml.safe_load(fh)
+    data = _load_manifest(yaml_path)
+
+    deployments = [
+        _build_deployment(deployment_config)
+        for deployment_config in data.get("deployments", [])
+    ]
 
-    deployments = data.get("deployments", [])
+    asyncio.run(_apply_deployments(deployments))
 
-    for deployment_config in deployments:
-        register_deployment(deployment_config)
+
+async def _apply_deployments(deployments: list[RunnerDeployment]) -> None:
+    """Apply deployments concurrently; each apply is an independent API round-trip."""
+
+    await asyncio.gather(*(asyncio.to_thread(d.apply) for d in deployments))
 
 
 def register_deployment(config: dict[str, object]) -> None:
+    _build_deployment(config).apply()
+
+
+@functools.lru_cache(maxsize=None)
+def _load_flow(entrypoint: str) -> Flow:
+    return load_flow_from_entrypoint(entrypoint)
+
+
+def _build_deployment(config: dict[str, object]) -> RunnerDeployment:
     entrypoint = config["entrypoint"]
-    flow = load_flow_from_entrypoint(entrypoint)
+    flow = _load_flow(entrypoint)
 
     deployment = flow.to_deployment(  # type: ignore[arg-type]
         name=config["name"],
@@ -39,7 +79,7 @@ def register_deployment(config: dict[str, object]) -> None:
         deployment.flow_name = config.get("flow_name") or flow.name
         deployment.entrypoint = entrypoint
 
-    deployment.apply()
+    return deployment
 
 
 if __name__ == "__main__":
@@ -4,8 +4,10 @@ from __future__ import annotations
 
 from typing import Optional
 
+from botocore.exceptions import ClientError
 from prefect import flow, get_run_logger
 
+from stevedore.blocks import MinIOBucket, load_block
 from stevedore.tasks.audio import extract_audio_asset
 
 
@@ -22,17 +24,36 @@ async def audio_extraction_flow(
     logger = get_run_logger()
     logger.info("Starting audio extraction for task '%s'", task_id)
 
+    # The source ETag is part of the task's cache key, so an unchanged source
+    # reuses the previous artifact instead of running FFmpeg again. The task
+    # takes size and ETag from this HEAD rather than issuing its own, and reuses
+    # the block and connection it loaded.
+    source_metadata = await _source_metadata(minio_bucket_block, source_object_path)
     audio_path = await extract_audio_asset(
         source_object_path=source_object_path,
         task_id=task_id,
         minio_bucket_block=minio_bucket_block,
         object_name=object_name,
+        source_etag=source_metadata.get("ETag"),
+        source_size=source_metadata.get("ContentLength"),
     )
 
     logger.info("Audio extraction completed for task '%s'", task_id)
     return audio_path
 
 
+async def _source_metadata(minio_bucket_block: str, source_object_path: str) -> dict:
+    """Return HEAD metadata for the source, or an empty dict if it does not exist."""
+
+    bucket_config = await load_block(MinIOBucket, minio_bucket_block)
+    try:
+        return await bucket_config.head_object(source_object_path)
+    except ClientError as exc:
+        if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") == 404:
+            return {}
+        raise
+
+
 __all__ = ["audio_extraction_flow"]
 
 
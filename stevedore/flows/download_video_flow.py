@@ -6,7 +6,9 @@ from typing import Optional
 
 from prefect import flow
 
+from stevedore.blocks import MinIOBucket, warm_block
 from stevedore.tasks import download_video_asset
+from stevedore.tasks.downloads import http_client_session
 
 
 @flow(name="Cobalt Video Download")
@@ -19,13 +21,15 @@ async def cobalt_video_download_flow(
 ) -> str:
     """Download a video via Cobalt and persist it to MinIO."""
 
-    return await download_video_asset(
-        source_url=source_url,
-        task_id=task_id,
-        cobalt_settings_block=cobalt_settings_block,
-        minio_bucket_block=minio_bucket_block,
-        object_name=object_name,
-    )
+    # The task picks up the bucket block warmed here once its load completes.
+    async with warm_block(MinIOBucket, minio_bucket_block), http_client_session():
+        return await download_video_asset(
+            source_url=source_url,
+            task_id=task_id,
+            cobalt_settings_block=cobalt_settings_block,
+            minio_bucket_block=minio_bucket_block,
+            object_name=object_name,
+        )
 
 
 __all__ = ["cobalt_video_download_flow"]
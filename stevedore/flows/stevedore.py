@@ -8,6 +8,9 @@ from prefect import flow
 from prefect.deployments import run_deployment
 from prefect.flow_runs import wait_for_flow_run
 
+DOWNLOAD_DEPLOYMENT = "cobalt-video-download/cobalt-download-worker"
+AUDIO_DEPLOYMENT = "audio-extraction/audio-processing"
+
 
 @flow(name="Video to Audio Pipeline")
 async def video_pipeline_flow(
@@ -21,7 +24,7 @@ async def video_pipeline_flow(
     """Download a video then trigger audio extraction as a downstream deployment."""
 
     download_flow_run = await run_deployment(
-        "cobalt-video-download/cobalt-download-worker",
+        DOWNLOAD_DEPLOYMENT,
         parameters={
             "source_url": source_url,
             "task_id": task_id,
@@ -38,7 +41,7 @@ async def video_pipeline_flow(
     download_result = await download_state.aresult()
 
     audio_flow_run = await run_deployment(
-        "audio-extraction/audio-processing",
+        AUDIO_DEPLOYMENT,
         parameters={
             "source_object_path": download_result["video"],
             "task_id": task_id,
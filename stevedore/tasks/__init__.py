@@ -1,10 +1,11 @@
 """Prefect task collections for the stevedore project."""
 
 from .audio import extract_audio_asset  # noqa: F401
-from .downloads import download_video_asset  # noqa: F401
+from .downloads import download_video_asset, download_video_assets  # noqa: F401
 
 __all__ = [
     "extract_audio_asset",
     "download_video_asset",
+    "download_video_assets",
 ]
 
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
-import subprocess
+import asyncio
+import shutil
 import tempfile
-from pathlib import Path, PurePosixPath
-from typing import Optional
+from datetime import timedelta
+from pathlib import Path
+from typing import Any, Optional
 
 from prefect import get_run_logger, task
 from prefect.artifacts import create_markdown_artifact
-from prefect.utilities.asyncutils import run_sync_in_worker_thread
+from prefect.context import TaskRunContext
+from prefect.tasks import task_input_hash
 
-from stevedore.blocks import MinIOBucket
+from stevedore.blocks import MinIOBucket, load_block
+from stevedore.tasks.scratch import scratch_root
 
 
 class AudioExtractionError(RuntimeError):
@@ -24,47 +28,67 @@ def _derive_storage_key(
     task_id: str,
     bucket_prefix: Optional[str],
     object_name: Optional[str],
-) -> tuple[PurePosixPath, str]:
+) -> tuple[str, str]:
     """Derive the S3 key for the extracted audio artifact.
 
     Returns the relative key (without task prefix) and the full storage key.
     """
 
-    source_key = PurePosixPath(source_object_path)
-    parts = list(source_key.parts)
+    parts = [part for part in source_object_path.split("/") if part not in {"", "."}]
 
-    if parts and parts[0] == task_id:
-        parts = parts[1:]
-    if parts and parts[0] == "download":
-        parts = parts[1:]
+    relative_parts = parts
+    if relative_parts and relative_parts[0] == task_id:
+        relative_parts = relative_parts[1:]
+    if relative_parts and relative_parts[0] == "download":
+        relative_parts = relative_parts[1:]
+    if not relative_parts:
+        relative_parts = parts[-1:]
 
-    relative_key = PurePosixPath(*parts) if parts else PurePosixPath(source_key.name)
+    source_name = relative_parts[-1] if relative_parts else ""
+    dot = source_name.rfind(".")
+    stem = source_name[:dot] if 0 < dot < len(source_name) - 1 else source_name
+    audio_name = object_name or f"{stem}.audio.mka"
 
-    source_name = Path(relative_key.name)
-    inferred_name = f"{source_name.stem}.audio.mka"
-    audio_name = object_name or inferred_name
+    audio_relative = "/".join(["extract-audio", *relative_parts[:-1], audio_name])
 
-    audio_relative = PurePosixPath("extract-audio")
-    parent = relative_key.parent
-    if str(parent) not in {".", ""}:
-        audio_relative /= parent
-    audio_relative /= audio_name
+    prefix = bucket_prefix.strip("/") if bucket_prefix else ""
+    if prefix:
+        audio_relative = f"{prefix}/{audio_relative}"
 
-    if bucket_prefix:
-        prefix_path = PurePosixPath(bucket_prefix.strip("/"))
-        audio_relative = prefix_path / audio_relative
+    return audio_relative, f"{task_id}/{audio_relative}"
 
-    storage_key = PurePosixPath(task_id) / audio_relative
-    return audio_relative, storage_key.as_posix()
 
+def _extract_cache_key(
+    context: TaskRunContext, parameters: dict[str, Any]
+) -> Optional[str]:
+    """Cache key over the task inputs, including the source object's ETag.
 
-@task(name="Extract audio via FFmpeg", persist_result=True, tags={"audio-processing"})
+    Re-extracting an unchanged source produces an identical artifact, so a
+    matching key skips FFmpeg and the upload. Returns ``None`` (no caching) when
+    the caller did not supply ``source_etag``.
+    """
+
+    if not parameters.get("source_etag"):
+        return None
+
+    return task_input_hash(context, parameters)
+
+
+@task(
+    name="Extract audio via FFmpeg",
+    persist_result=True,
+    tags={"audio-processing"},
+    cache_key_fn=_extract_cache_key,
+    cache_expiration=timedelta(days=7),
+)
 async def extract_audio_asset(
     *,
     source_object_path: str,
     task_id: str,
     minio_bucket_block: str,
     object_name: Optional[str] = None,
+    source_etag: Optional[str] = None,
+    source_size: Optional[int] = None,
 ) -> str:
     """Extract the primary audio track from a downloaded video.
 
@@ -77,6 +101,10 @@ async def extract_audio_asset(
         minio_bucket_block: Name of the ``MinIOBucket`` Prefect block to load.
         object_name: Optional override for the audio filename within the task
             namespace.
+        source_etag: ETag of the source object. When given, results are cached
+            for seven days per source content; without it the task always runs.
+        source_size: Size of the source object in bytes, from the same HEAD as
+            ``source_etag``. The source is only HEADed here when no ETag is given.
 
     Returns:
         The S3/MinIO key of the uploaded audio artifact.
@@ -87,7 +115,7 @@ async def extract_audio_asset(
 
     logger = get_run_logger()
 
-    bucket_config = await MinIOBucket.load(minio_bucket_block)
+    bucket_config = await load_block(MinIOBucket, minio_bucket_block)
     s3_bucket = await bucket_config.load_bucket()
 
     _, storage_key = _derive_storage_key(
@@ -97,47 +125,77 @@ async def extract_audio_asset(
         object_name=object_name,
     )
 
-    working_dir = Path(tempfile.mkdtemp(prefix="audio-extract-"))
-    source_path = working_dir / Path(source_object_path).name
+    # The audio track is never larger than its source, so the source size bounds
+    # the scratch space needed; size and ETag are also recorded in the artifact.
+    if source_etag is None:
+        source_metadata = await bucket_config.head_object(source_object_path, bucket=s3_bucket)
+    else:
+        source_metadata = {"ContentLength": source_size, "ETag": source_etag}
+
+    working_dir = Path(
+        tempfile.mkdtemp(
+            prefix="audio-extract-",
+            dir=scratch_root(source_metadata.get("ContentLength")),
+        )
+    )
     audio_filename = Path(storage_key).name
     audio_path = working_dir / audio_filename
 
     try:
-        logger.info("Downloading source video '%s'", source_object_path)
-        await s3_bucket.adownload_object_to_path(
-            from_path=source_object_path,
-            to_path=source_path,
-        )
+        # FFmpeg reads the source over HTTP(S) using ranged requests, so the video
+        # is never staged on local disk and MP4s with a trailing moov atom can
+        # still be demuxed (which a stdin pipe would not allow).
+        source_url = await bucket_config.presigned_url(source_object_path, bucket=s3_bucket)
 
+        # A stream copy does no codec work, so FFmpeg's default thread pools only
+        # oversubscribe the CPU when several extractions run concurrently.
         command = [
             "ffmpeg",
+            "-nostdin",
+            "-hide_banner",
+            "-loglevel",
+            "error",
+            "-threads",
+            "1",
             "-y",
             "-i",
-            str(source_path),
+            source_url,
             "-map",
             "0:a:0",
             "-c:a",
             "copy",
+            "-threads",
+            "1",
             str(audio_path),
         ]
 
-        logger.info("Running FFmpeg to extract audio: %s", " ".join(command))
+        logger.info("Running FFmpeg to extract audio from '%s'", source_object_path)
 
         try:
-            result = await run_sync_in_worker_thread(
-                subprocess.run,
-                command,
-                capture_output=True,
-                text=True,
-                check=False,
+            process = await asyncio.create_subprocess_exec(
+                *command,
+                stdout=asyncio.subprocess.PIPE,
+                stderr=asyncio.subprocess.PIPE,
             )
         except FileNotFoundError as exc:
             raise AudioExtractionError("FFmpeg binary not found in PATH") from exc
 
-        if result.returncode != 0:
-            stderr = result.stderr or "Unknown FFmpeg error"
+        try:
+            _, stderr_bytes = await process.communicate()
+        except BaseException:
+            # On cancellation FFmpeg would keep writing into working_dir while it
+            # is removed below, so it is stopped first.
+            if process.returncode is None:
+                process.kill()
+            await process.wait()
+            raise
+
+        if process.returncode != 0:
+            stderr = (
+                stderr_bytes.decode("utf-8", errors="replace") or "Unknown FFmpeg error"
+            ).replace(source_url, source_object_path)
             raise AudioExtractionError(
-                f"FFmpeg failed with exit code {result.returncode}: {stderr}"
+                f"FFmpeg failed with exit code {process.returncode}: {stderr}"
             )
 
         if not audio_path.exists() or audio_path.stat().st_size == 0:
@@ -149,47 +207,37 @@ async def extract_audio_asset(
             to_path=storage_key,
         )
 
+        rows = [
+            ("Task ID", task_id),
+            ("Source Object", source_object_path),
+            ("Audio Object", storage_path),
+        ]
+        source_object_size = source_metadata.get("ContentLength")
+        if source_object_size is not None:
+            rows.append(("Source Size", f"{source_object_size} bytes"))
+        source_object_etag = source_metadata.get("ETag")
+        if source_object_etag:
+            rows.append(("Source ETag", source_object_etag))
         head_metadata = await bucket_config.head_object(storage_key, bucket=s3_bucket)
 
         await create_markdown_artifact(
             key=f"audio-{task_id}",
-            markdown=_render_artifact_markdown(
-                task_id=task_id,
-                source_object_path=source_object_path,
-                audio_object_path=storage_path,
-                head_metadata=head_metadata,
-            ),
+            markdown=_render_artifact_markdown(rows=rows, head_metadata=head_metadata),
             description="Metadata for extracted audio artifact.",
         )
 
         logger.info("Audio extraction succeeded; stored object: %s", storage_path)
         return storage_path
     finally:
-        for temp_path in (source_path, audio_path):
-            try:
-                if temp_path.exists():
-                    temp_path.unlink()
-            except OSError:
-                pass
-
-        try:
-            working_dir.rmdir()
-        except OSError:
-            pass
+        await asyncio.to_thread(shutil.rmtree, working_dir, ignore_errors=True)
 
 
 def _render_artifact_markdown(
     *,
-    task_id: str,
-    source_object_path: str,
-    audio_object_path: str,
+    rows: list[tuple[str, str]],
     head_metadata: dict,
 ) -> str:
-    rows = [
-        ("Task ID", task_id),
-        ("Source Object", source_object_path),
-        ("Audio Object", audio_object_path),
-    ]
+    rows = list(rows)
 
     size_bytes = head_metadata.get("ContentLength")
     if size_bytes is not None:
@@ -203,11 +251,14 @@ def _render_artifact_markdown(
     if last_modified:
         rows.append(("Last Modified", str(last_modified)))
 
-    header = "| Field | Value |"
-    separator = "| --- | --- |"
-    body = "\n".join(f"| {field} | {value} |" for field, value in rows)
-
-    return f"## Audio Extraction\n{header}\n{separator}\n{body}"
+    return "\n".join(
+        [
+            "## Audio Extraction",
+            "| Field | Value |",
+            "| --- | --- |",
+            *[f"| {field} | {value} |" for field, value in rows],
+        ]
+    )
 
 
 __all__ = ["AudioExtractionError", "extract_audio_asset"]
\ No newline at end of file
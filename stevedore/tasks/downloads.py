@@ -2,25 +2,139 @@
 
 from __future__ import annotations
 
-import json
-import subprocess
+import asyncio
+import hashlib
+import os
+import shutil
 import tempfile
+import threading
+import weakref
+from collections import deque
+from contextlib import asynccontextmanager
 from datetime import timedelta
 from pathlib import Path
-from typing import Optional
+from typing import Any, AsyncIterator, Iterable, Mapping, Optional
 
 import httpx
+import orjson
+from botocore.exceptions import ClientError
+from cachetools import LRUCache, TTLCache
 from prefect import task
 from prefect.artifacts import create_markdown_artifact
 from prefect.tasks import task_input_hash
 
-from stevedore.blocks import CobaltSettings, MinIOBucket
+from stevedore.blocks import CobaltSettings, MinIOBucket, load_block
+from stevedore.tasks.scratch import scratch_root
 
 
 class CobaltDownloadError(RuntimeError):
     """Raised when the Cobalt service fails to provide a downloadable asset."""
 
 
+# Chunk size requested from httpx when streaming downloads.
+_DOWNLOAD_CHUNK_BYTES = 1024 * 1024
+
+# Probe results are stored on the uploaded object as user metadata under this
+# prefix, so reuse runs can read them from the HEAD instead of running ffprobe.
+# Self-copies above the S3 single-copy limit are skipped.
+_PROBE_METADATA_PREFIX = "probe-"
+_MAX_METADATA_COPY_BYTES = 5 * 1024 * 1024 * 1024
+
+# Downloads that advertise byte-range support are fetched as concurrent ranges of
+# this size, matching the multipart upload part size.
+_RANGE_CHUNK_BYTES = 8 * 1024 * 1024
+_RANGE_CONCURRENCY = 8
+
+# Bytes fetched from each end of an object when probing it without a local copy.
+_PROBE_SAMPLE_BYTES = 1024 * 1024
+
+# Raw ffprobe output keyed by S3 ETag (a content hash), kept in memory and on
+# disk so reruns over the same object do not spawn ffprobe again. Both tiers are
+# bounded: once the disk cache grows past the limit, its least recently used
+# files are pruned down to three quarters of it. The file count is scanned once
+# and then tracked, so ordinary writes do not list the directory.
+_PROBE_CACHE: LRUCache = LRUCache(maxsize=1024)
+_PROBE_CACHE_DIR = Path.home() / ".cache" / "stevedore" / "ffprobe"
+_PROBE_CACHE_MAX_FILES = 4096
+_PROBE_CACHE_FILES: Optional[int] = None
+_PROBE_CACHE_FILES_LOCK = threading.Lock()
+
+# HEAD metadata keyed by (bucket name, resolved key), so sibling tasks checking
+# the same object within the TTL skip the round trip. Misses are not cached.
+_HEAD_CACHE: TTLCache = TTLCache(maxsize=1024, ttl=8 * 60 * 60)
+_HEAD_CACHE_LOCK = threading.Lock()
+_HEAD_CACHE_FIELDS = ("ContentLength", "ETag", "LastModified", "Metadata")
+
+# Endpoint URL per loaded S3Bucket block. Block models are unhashable, so entries
+# are keyed by identity and dropped when the bucket is garbage collected.
+_BUCKET_ENDPOINTS: dict[int, tuple[weakref.ref, Optional[str]]] = {}
+
+# One pooled HTTP/2 client per event loop, shared by the Cobalt API request and
+# the download stream so connections are reused across calls and task runs.
+_HTTP_CLIENTS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient] = (
+    weakref.WeakKeyDictionary()
+)
+
+# Number of open ``http_client_session`` scopes per event loop; the shared client
+# is closed when the last one exits.
+_HTTP_CLIENT_USERS: weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, int] = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# In-flight downloads per event loop, keyed by bucket block, task ID and object
+# name, so concurrent calls for the same object share a single run.
+_INFLIGHT: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[tuple[str, str, Optional[str]], "_SharedRun"]
+] = weakref.WeakKeyDictionary()
+
+
+class _SharedRun:
+    """A download shared by concurrent callers, with the number still waiting."""
+
+    __slots__ = ("future", "waiters")
+
+    def __init__(self, future: asyncio.Future) -> None:
+        self.future = future
+        self.waiters = 0
+
+
+def _get_http_client() -> httpx.AsyncClient:
+    loop = asyncio.get_running_loop()
+    client = _HTTP_CLIENTS.get(loop)
+    if client is None:
+        client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=100, max_keepalive_connections=50),
+        )
+        _HTTP_CLIENTS[loop] = client
+    return client
+
+
+@asynccontextmanager
+async def http_client_session() -> AsyncIterator[httpx.AsyncClient]:
+    """Hold the shared Cobalt HTTP client open for the duration of the block.
+
+    Sessions on the same event loop are reference counted, so concurrent flows
+    keep using one pooled client and it is closed only when the last session
+    exits.
+    """
+
+    loop = asyncio.get_running_loop()
+    _HTTP_CLIENT_USERS[loop] = _HTTP_CLIENT_USERS.get(loop, 0) + 1
+    try:
+        yield _get_http_client()
+    finally:
+        users = _HTTP_CLIENT_USERS[loop] - 1
+        if users:
+            _HTTP_CLIENT_USERS[loop] = users
+        else:
+            del _HTTP_CLIENT_USERS[loop]
+            client = _HTTP_CLIENTS.pop(loop, None)
+            if client is not None:
+                await client.aclose()
+
+
 @task(
     name="Download video via Cobalt",
     persist_result=True,
@@ -52,19 +166,63 @@ async def download_video_asset(
         httpx.HTTPError: On network-level failures when communicating with Cobalt.
     """
 
-    cobalt_settings = await CobaltSettings.load(cobalt_settings_block)
-    bucket_config = await MinIOBucket.load(minio_bucket_block)
+    # Concurrent runs targeting the same object share one download. Each caller
+    # waits through a shield, and the download is cancelled only once every
+    # caller waiting on it has been cancelled.
+    inflight = _INFLIGHT.setdefault(asyncio.get_running_loop(), {})
+    key = (minio_bucket_block, task_id, object_name)
+    shared = inflight.get(key)
+    if shared is None:
+        shared = inflight[key] = _SharedRun(
+            asyncio.ensure_future(
+                _download_video_asset(
+                    source_url=source_url,
+                    task_id=task_id,
+                    cobalt_settings_block=cobalt_settings_block,
+                    minio_bucket_block=minio_bucket_block,
+                    object_name=object_name,
+                )
+            )
+        )
+        shared.future.add_done_callback(
+            lambda _: inflight.pop(key) if inflight.get(key) is shared else None
+        )
+
+    shared.waiters += 1
+    try:
+        return await asyncio.shield(shared.future)
+    finally:
+        shared.waiters -= 1
+        if not shared.waiters and not shared.future.done():
+            if inflight.get(key) is shared:
+                del inflight[key]
+            shared.future.cancel()
+
+
+async def _download_video_asset(
+    *,
+    source_url: str,
+    task_id: str,
+    cobalt_settings_block: str,
+    minio_bucket_block: str,
+    object_name: Optional[str],
+) -> str:
+    cobalt_settings, bucket_config = await asyncio.gather(
+        load_block(CobaltSettings, cobalt_settings_block),
+        load_block(MinIOBucket, minio_bucket_block),
+    )
     s3_bucket = await bucket_config.load_bucket()
 
-    async with httpx.AsyncClient(timeout=cobalt_settings.request_timeout_seconds) as client:
-        response = await client.post(
-            cobalt_settings.base_url,
-            json={"url": source_url},
-            headers=cobalt_settings.headers(),
-        )
-        response.raise_for_status()
+    client = _get_http_client()
+    response = await client.post(
+        cobalt_settings.base_url,
+        json={"url": source_url},
+        headers=cobalt_settings.headers(),
+        timeout=cobalt_settings.request_timeout_seconds,
+    )
+    response.raise_for_status()
 
-        payload = response.json()
+    payload = orjson.loads(response.content)
 
     status = payload.get("status")
     if status not in {"tunnel", "redirect"}:
@@ -87,13 +245,18 @@ async def download_video_asset(
     storage_key = "/".join(filter(None, [task_id, "download", object_key]))
     resolved_storage_path = s3_bucket._resolve_path(storage_key)
 
-    if await bucket_config.object_exists(storage_key, bucket=s3_bucket):
-        head_data = await bucket_config.head_object(storage_key, bucket=s3_bucket)
-        media_metadata = await _gather_media_metadata(
-            bucket=s3_bucket,
-            key=storage_key,
-            head_metadata=head_data,
-        )
+    # A single HEAD both checks for an existing object and provides its metadata.
+    head_data = await _head_if_exists(bucket_config, storage_key, bucket=s3_bucket)
+
+    if head_data is not None:
+        media_metadata = _stored_probe_metadata(head_data)
+        if media_metadata is None:
+            media_metadata = await _gather_media_metadata(
+                bucket_config,
+                bucket=s3_bucket,
+                key=storage_key,
+                head_metadata=head_data,
+            )
         await _emit_download_artifact(
             task_id=task_id,
             storage_uri=f"s3://{s3_bucket.bucket_name}/{resolved_storage_path}",
@@ -105,59 +268,324 @@ async def download_video_asset(
         )
         return resolved_storage_path
 
-    temp_dir = tempfile.mkdtemp(prefix="cobalt-download-")
+    # The HEAD only plans the download; if it fails, a plain GET is used instead.
+    try:
+        probe = await client.head(
+            download_url,
+            follow_redirects=True,
+            timeout=cobalt_settings.request_timeout_seconds,
+        )
+    except httpx.HTTPError:
+        probe = None
+
+    if probe is not None and probe.status_code < 400:
+        ranged_size = _ranged_download_size(probe)
+        advertised_size = _advertised_size(probe)
+        # Later requests go straight to the URL the redirect chain settled on.
+        resolved_url = str(probe.url)
+    else:
+        ranged_size = advertised_size = None
+        resolved_url = download_url
+
+    # The local copy is spooled to tmpfs when the advertised size fits there.
+    temp_dir = tempfile.mkdtemp(
+        prefix="cobalt-download-",
+        dir=scratch_root(advertised_size),
+    )
     temp_file_path = Path(temp_dir) / file_name
 
-    async with httpx.AsyncClient(timeout=cobalt_settings.download_timeout_seconds) as client:
-        async with client.stream("GET", download_url) as stream:
-            stream.raise_for_status()
+    # ffprobe starts as soon as the local copy is complete, overlapping the
+    # remaining part uploads and the multipart completion.
+    download_complete = asyncio.Event()
+    probe_task = asyncio.ensure_future(
+        _run_ffprobe_when_set(download_complete, temp_file_path)
+    )
+
+    try:
+        # Parts are uploaded to MinIO while the download is still running; the
+        # bytes are also kept locally so ffprobe can inspect the file afterwards.
+        if ranged_size is not None:
+            storage_path = await bucket_config.upload_stream(
+                storage_key,
+                _tee_to_file(
+                    _fetch_ranges(
+                        client,
+                        resolved_url,
+                        ranged_size,
+                        timeout=cobalt_settings.download_timeout_seconds,
+                    ),
+                    temp_file_path,
+                    size_hint=ranged_size,
+                    complete=download_complete,
+                ),
+                bucket=s3_bucket,
+            )
+        else:
+            async with client.stream(
+                "GET",
+                resolved_url,
+                timeout=cobalt_settings.download_timeout_seconds,
+            ) as stream:
+                stream.raise_for_status()
+
+                content_length = stream.headers.get("content-length")
+                storage_path = await bucket_config.upload_stream(
+                    storage_key,
+                    _tee_to_file(
+                        stream.aiter_bytes(chunk_size=_DOWNLOAD_CHUNK_BYTES),
+                        temp_file_path,
+                        size_hint=int(content_length) if content_length else None,
+                        complete=download_complete,
+                    ),
+                    bucket=s3_bucket,
+                )
+
+        head_data, probe_output = await asyncio.gather(
+            bucket_config.head_object(storage_key, bucket=s3_bucket),
+            probe_task,
+        )
+        head_data = _cache_head(s3_bucket, storage_key, head_data)
+
+        media_metadata: dict[str, Optional[str]] = {}
+        size_bytes = head_data.get("ContentLength")
+        if size_bytes is not None:
+            media_metadata["size_bytes"] = str(size_bytes)
+        if probe_output is not None:
+            media_metadata.update(_parse_ffprobe_output(probe_output))
+            head_data = await _store_probe_metadata(
+                bucket_config,
+                storage_key,
+                bucket=s3_bucket,
+                head_data=head_data,
+                media_metadata=media_metadata,
+            )
+            # The metadata copy replaces the object's ETag, so the ETag-keyed cache
+            # is only needed (and only valid) when the copy was skipped or failed.
+            etag = head_data.get("ETag")
+            if etag and _stored_probe_metadata(head_data) is None:
+                await _write_probe_cache(etag, probe_output)
+
+        await _emit_download_artifact(
+            task_id=task_id,
+            storage_uri=f"s3://{s3_bucket.bucket_name}/{storage_path}",
+            endpoint_url=_resolve_bucket_endpoint(s3_bucket),
+            media_metadata=media_metadata,
+            head_metadata=head_data,
+            reused=False,
+            source_url=source_url,
+        )
+    finally:
+        probe_task.cancel()
+        await asyncio.to_thread(shutil.rmtree, temp_dir, ignore_errors=True)
 
-            with temp_file_path.open("wb") as file_buffer:
-                async for chunk in stream.aiter_bytes():
-                    file_buffer.write(chunk)
+    return storage_path
 
-    storage_path = await s3_bucket.aupload_from_path(
-        from_path=temp_file_path,
-        to_path=storage_key,
-    )
 
-    head_data = await bucket_config.head_object(storage_key, bucket=s3_bucket)
-    media_metadata = await _gather_media_metadata(
-        bucket=s3_bucket,
-        key=storage_key,
-        head_metadata=head_data,
-        local_path=temp_file_path,
-    )
-    await _emit_download_artifact(
-        task_id=task_id,
-        storage_uri=f"s3://{s3_bucket.bucket_name}/{storage_path}",
-        endpoint_url=_resolve_bucket_endpoint(s3_bucket),
-        media_metadata=media_metadata,
-        head_metadata=head_data,
-        reused=False,
-        source_url=source_url,
+async def download_video_assets(
+    items: Iterable[Mapping[str, Any]],
+    *,
+    concurrency: int = 8,
+) -> list[str]:
+    """Run ``download_video_asset`` for each item with bounded concurrency.
+
+    Args:
+        items: Keyword arguments for each ``download_video_asset`` call.
+        concurrency: Maximum number of downloads in flight at once.
+
+    Returns:
+        The stored object paths, in the same order as ``items``.
+
+    If any download fails, the remaining ones are cancelled and the error is
+    re-raised.
+    """
+
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def run(item: Mapping[str, Any]) -> str:
+        async with semaphore:
+            return await download_video_asset(**item)
+
+    async with http_client_session():
+        tasks = [asyncio.ensure_future(run(item)) for item in items]
+        try:
+            return list(await asyncio.gather(*tasks))
+        except BaseException:
+            for pending in tasks:
+                pending.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+            raise
+
+
+async def _head_if_exists(bucket_config, key: str, *, bucket) -> Optional[dict]:
+    """Return HEAD metadata for ``key``, or ``None`` when the object is missing.
+
+    Results are served from ``_HEAD_CACHE`` when present.
+    """
+
+    cache_key = (bucket.bucket_name, bucket._resolve_path(key))
+    with _HEAD_CACHE_LOCK:
+        cached = _HEAD_CACHE.get(cache_key)
+    if cached is not None:
+        return cached
+
+    try:
+        head_data = await bucket_config.head_object(key, bucket=bucket)
+    except ClientError as exc:
+        if exc.response.get("ResponseMetadata", {}).get("HTTPStatusCode") != 404:
+            raise
+        return None
+
+    return _cache_head(bucket, key, head_data)
+
+
+def _cache_head(bucket, key: str, head_data: dict) -> dict:
+    """Store the fields of ``head_data`` the task uses and return them."""
+
+    entry = {field: head_data[field] for field in _HEAD_CACHE_FIELDS if field in head_data}
+    with _HEAD_CACHE_LOCK:
+        _HEAD_CACHE[(bucket.bucket_name, bucket._resolve_path(key))] = entry
+    return entry
+
+
+def _advertised_size(response) -> Optional[int]:
+    """Return the ``Content-Length`` of a successful response, if present."""
+
+    content_length = response.headers.get("content-length", "")
+    if response.status_code >= 400 or not content_length.isdigit():
+        return None
+    return int(content_length)
+
+
+def _ranged_download_size(response) -> Optional[int]:
+    """Return the body size when ``response`` allows a ranged download, else ``None``.
+
+    Bodies that fit in a single range are streamed normally.
+    """
+
+    if response.headers.get("accept-ranges") != "bytes":
+        return None
+
+    size = _advertised_size(response)
+    if size is None or size <= _RANGE_CHUNK_BYTES:
+        return None
+    return size
+
+
+async def _fetch_ranges(
+    client: httpx.AsyncClient,
+    url: str,
+    total_size: int,
+    *,
+    timeout: float,
+) -> AsyncIterator[bytes]:
+    """Yield the body of ``url`` in order, fetched as concurrent byte ranges.
+
+    At most ``_RANGE_CONCURRENCY`` ranges are in flight or buffered at once.
+    """
+
+    async def fetch(start: int, end: int) -> bytes:
+        response = await client.get(
+            url,
+            headers={"Range": f"bytes={start}-{end}"},
+            timeout=timeout,
+        )
+        response.raise_for_status()
+        if response.status_code != 206 or len(response.content) != end - start + 1:
+            raise CobaltDownloadError("Download server did not honour the byte range request.")
+        return response.content
+
+    ranges = deque(
+        (start, min(start + _RANGE_CHUNK_BYTES, total_size) - 1)
+        for start in range(0, total_size, _RANGE_CHUNK_BYTES)
     )
+    pending: deque[asyncio.Future] = deque()
+    try:
+        while ranges or pending:
+            while ranges and len(pending) < _RANGE_CONCURRENCY:
+                pending.append(asyncio.ensure_future(fetch(*ranges.popleft())))
+            yield await pending.popleft()
+    finally:
+        for future in pending:
+            future.cancel()
+
+
+async def _tee_to_file(
+    chunks: AsyncIterator[bytes],
+    path: Path,
+    *,
+    size_hint: Optional[int] = None,
+    complete: Optional[asyncio.Event] = None,
+) -> AsyncIterator[bytes]:
+    """Yield ``chunks`` unchanged while also writing them to ``path``.
+
+    Chunks are written straight to the file descriptor, bypassing Python's
+    buffered writer, and the file is preallocated when its size is known.
+    ``complete`` is set once every chunk has been written and the file closed.
+    """
 
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
     try:
-        temp_file_path.unlink()
-        Path(temp_dir).rmdir()
-    except OSError:
-        pass
+        if size_hint and hasattr(os, "posix_fallocate"):
+            # Preallocation can zero-fill on filesystems without native support,
+            # so it runs in a worker thread and completes before the first write.
+            try:
+                await asyncio.to_thread(os.posix_fallocate, fd, 0, size_hint)
+            except OSError:
+                pass
+
+        async for chunk in chunks:
+            view = memoryview(chunk)
+            while view:
+                view = view[os.write(fd, view):]
+            yield chunk
+    finally:
+        os.close(fd)
+
+    if complete is not None:
+        complete.set()
+
+
+async def _probe_media_metadata(
+    path: Path | str | None,
+    cache_key: Optional[str] = None,
+) -> dict[str, Optional[str]]:
+    """Extract media metadata using ffprobe; falls back gracefully.
 
-    return storage_path
+    When ``cache_key`` (the object's ETag) is given, the raw ffprobe output is
+    cached under it so later probes of the same content skip ffprobe entirely.
+    """
 
+    raw_output = await _read_probe_cache(cache_key) if cache_key else None
 
-def _probe_media_metadata(path: Path | str) -> dict[str, Optional[str]]:
-    """Extract media metadata using ffprobe; falls back gracefully."""
+    if raw_output is None:
+        raw_output = await _run_ffprobe(path)
+        if raw_output is None:
+            return {}
+        if cache_key:
+            await _write_probe_cache(cache_key, raw_output)
 
-    file_path = Path(path)
-    if not file_path.exists():
-        return {}
+    return _parse_ffprobe_output(raw_output)
+
+
+async def _run_ffprobe_when_set(event: asyncio.Event, path: Path) -> Optional[bytes]:
+    await event.wait()
+    return await _run_ffprobe(path)
+
+
+async def _run_ffprobe(path: Path | str | None) -> Optional[bytes]:
+    """Return ffprobe's raw JSON output for ``path``, or ``None`` on failure."""
+
+    if path is None or not Path(path).exists():
+        return None
 
     ffprobe_cmd = [
         "ffprobe",
         "-v",
         "error",
+        "-analyzeduration",
+        "10M",
+        "-probesize",
+        "10M",
         "-select_streams",
         "v:0",
         "-show_entries",
@@ -166,23 +594,36 @@ def _probe_media_metadata(path: Path | str) -> dict[str, Optional[str]]:
         "format=duration,size,bit_rate",
         "-of",
         "json",
-        str(file_path),
+        str(path),
     ]
 
     try:
-        proc = subprocess.run(
-            ffprobe_cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            check=True,
-            encoding="utf-8",
+        proc = await asyncio.create_subprocess_exec(
+            *ffprobe_cmd,
+            stdout=asyncio.subprocess.PIPE,
+            stderr=asyncio.subprocess.PIPE,
         )
-    except (subprocess.CalledProcessError, FileNotFoundError):
-        return {}
+    except FileNotFoundError:
+        return None
+
+    try:
+        stdout, _ = await proc.communicate()
+    except BaseException:
+        # probe_task is cancelled when a later step fails; don't orphan ffprobe.
+        if proc.returncode is None:
+            proc.kill()
+        await proc.wait()
+        raise
+    if proc.returncode != 0:
+        return None
+
+    return stdout
 
+
+def _parse_ffprobe_output(raw_output: bytes) -> dict[str, Optional[str]]:
     try:
-        data = json.loads(proc.stdout)
-    except json.JSONDecodeError:
+        data = orjson.loads(raw_output)
+    except orjson.JSONDecodeError:
         return {}
 
     result: dict[str, Optional[str]] = {}
@@ -209,7 +650,144 @@ def _probe_media_metadata(path: Path | str) -> dict[str, Optional[str]]:
     return result
 
 
+def _stored_probe_metadata(head_metadata: dict) -> Optional[dict[str, Optional[str]]]:
+    """Rebuild media metadata from probe fields stored on the object, if any."""
+
+    fields = {
+        name[len(_PROBE_METADATA_PREFIX):].replace("-", "_"): value
+        for name, value in (head_metadata.get("Metadata") or {}).items()
+        if name.startswith(_PROBE_METADATA_PREFIX)
+    }
+    if not fields:
+        return None
+
+    metadata: dict[str, Optional[str]] = {}
+    size_bytes = head_metadata.get("ContentLength")
+    if size_bytes is not None:
+        metadata["size_bytes"] = str(size_bytes)
+    metadata.update(fields)
+    return metadata
+
+
+async def _store_probe_metadata(
+    bucket_config,
+    key: str,
+    *,
+    bucket,
+    head_data: dict,
+    media_metadata: dict[str, Optional[str]],
+) -> dict:
+    """Attach probe fields to the object's user metadata and return its new HEAD data.
+
+    This is best effort: on failure the object is left as uploaded and
+    ``head_data`` is returned unchanged.
+    """
+
+    fields = {
+        f"{_PROBE_METADATA_PREFIX}{name.replace('_', '-')}": value
+        for name, value in media_metadata.items()
+        if value and name != "size_bytes" and value.isascii()
+    }
+    size_bytes = head_data.get("ContentLength") or 0
+    if not fields or size_bytes > _MAX_METADATA_COPY_BYTES:
+        return head_data
+
+    metadata = {**(head_data.get("Metadata") or {}), **fields}
+    try:
+        response = await bucket_config.replace_metadata(key, metadata, bucket=bucket)
+    except ClientError:
+        return head_data
+
+    copy_result = response.get("CopyObjectResult", {})
+    updated = {**head_data, "Metadata": metadata}
+    for field in ("ETag", "LastModified"):
+        if copy_result.get(field):
+            updated[field] = copy_result[field]
+    return _cache_head(bucket, key, updated)
+
+
+def _probe_cache_file(cache_key: str) -> Path:
+    digest = hashlib.sha256(cache_key.encode("utf-8")).hexdigest()
+    return _PROBE_CACHE_DIR / f"{digest}.json"
+
+
+async def _read_probe_cache(cache_key: str) -> Optional[bytes]:
+    """Return cached ffprobe output for ``cache_key`` from memory or disk."""
+
+    raw_output = _PROBE_CACHE.get(cache_key)
+    if raw_output is None:
+        raw_output = await asyncio.to_thread(_read_probe_cache_file, cache_key)
+        if raw_output is not None:
+            _PROBE_CACHE[cache_key] = raw_output
+    return raw_output
+
+
+async def _write_probe_cache(cache_key: str, raw_output: bytes) -> None:
+    _PROBE_CACHE[cache_key] = raw_output
+    await asyncio.to_thread(_write_probe_cache_file, cache_key, raw_output)
+
+
+def _read_probe_cache_file(cache_key: str) -> Optional[bytes]:
+    cache_file = _probe_cache_file(cache_key)
+    try:
+        raw_output = cache_file.read_bytes()
+        # Refresh the mtime so pruning evicts the least recently used files.
+        os.utime(cache_file)
+    except OSError:
+        return None
+    return raw_output
+
+
+def _write_probe_cache_file(cache_key: str, raw_output: bytes) -> None:
+    global _PROBE_CACHE_FILES
+
+    cache_file = _probe_cache_file(cache_key)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        existed = cache_file.exists()
+        cache_file.write_bytes(raw_output)
+        with _PROBE_CACHE_FILES_LOCK:
+            if _PROBE_CACHE_FILES is None:
+                _PROBE_CACHE_FILES = len(_list_probe_cache_files())
+            elif not existed:
+                _PROBE_CACHE_FILES += 1
+            if _PROBE_CACHE_FILES > _PROBE_CACHE_MAX_FILES:
+                _PROBE_CACHE_FILES = _prune_probe_cache(_PROBE_CACHE_MAX_FILES * 3 // 4)
+    except OSError:
+        pass
+
+
+def _list_probe_cache_files() -> list[os.DirEntry]:
+    with os.scandir(_PROBE_CACHE_DIR) as entries:
+        return [entry for entry in entries if entry.name.endswith(".json")]
+
+
+def _prune_probe_cache(keep: int) -> int:
+    """Delete all but the ``keep`` most recently used disk cache files.
+
+    Returns the number of files left in the cache.
+    """
+
+    files = _list_probe_cache_files()
+
+    def mtime(entry: os.DirEntry) -> float:
+        try:
+            return entry.stat().st_mtime
+        except OSError:
+            return 0.0
+
+    remaining = len(files)
+    for entry in sorted(files, key=mtime)[: max(remaining - keep, 0)]:
+        try:
+            os.unlink(entry.path)
+            remaining -= 1
+        except OSError:
+            pass
+    return remaining
+
+
 async def _gather_media_metadata(
+    bucket_config,
     *,
     bucket,
     key: str,
@@ -224,23 +802,29 @@ async def _gather_media_metadata(
     if size_bytes is not None:
         metadata["size_bytes"] = str(size_bytes)
 
+    cache_key = head_metadata.get("ETag")
     target_path = local_path
     cleanup_temp = False
 
-    if target_path is None:
+    if target_path is None and not (cache_key and await _read_probe_cache(cache_key)):
         temp_dir = tempfile.mkdtemp(prefix="cobalt-head-probe-")
         target_path = Path(temp_dir) / Path(key).name
         cleanup_temp = True
 
         try:
-            content = await bucket.aread_path(key)
-            target_path.write_bytes(content)
+            await _download_probe_sample(
+                bucket_config,
+                key,
+                bucket=bucket,
+                size_bytes=size_bytes,
+                path=target_path,
+            )
         except Exception:
             if cleanup_temp:
                 _safe_cleanup_tempfile(target_path)
             return metadata
 
-    metadata.update(_probe_media_metadata(target_path))
+    metadata.update(await _probe_media_metadata(target_path, cache_key=cache_key))
 
     if cleanup_temp:
         _safe_cleanup_tempfile(target_path)
@@ -248,14 +832,43 @@ async def _gather_media_metadata(
     return metadata
 
 
+async def _download_probe_sample(
+    bucket_config,
+    key: str,
+    *,
+    bucket,
+    size_bytes: Optional[int],
+    path: Path,
+) -> None:
+    """Write the head and tail of an object into a sparse file for ffprobe.
+
+    Container metadata lives at the start of the file (MKV, faststart MP4) or at
+    its end (MP4 with a trailing moov atom), so both ranges are fetched and
+    written at their original offsets instead of downloading the whole object.
+    """
+
+    if size_bytes and size_bytes > 2 * _PROBE_SAMPLE_BYTES:
+        ranges = [
+            (0, f"bytes=0-{_PROBE_SAMPLE_BYTES - 1}"),
+            (size_bytes - _PROBE_SAMPLE_BYTES, f"bytes=-{_PROBE_SAMPLE_BYTES}"),
+        ]
+    else:
+        ranges = [(0, f"bytes=0-{2 * _PROBE_SAMPLE_BYTES - 1}")]
+
+    samples = await asyncio.gather(
+        *(bucket_config.read_range(key, byte_range, bucket=bucket) for _, byte_range in ranges)
+    )
+
+    with path.open("wb") as file_buffer:
+        if size_bytes:
+            file_buffer.truncate(size_bytes)
+        for (offset, _), data in zip(ranges, samples):
+            file_buffer.seek(offset)
+            file_buffer.write(data)
+
+
 def _safe_cleanup_tempfile(path: Path) -> None:
-    try:
-        if path.exists():
-            path.unlink()
-        if path.parent.exists():
-            path.parent.rmdir()
-    except OSError:
-        pass
+    shutil.rmtree(path.parent, ignore_errors=True)
 
 
 async def _emit_download_artifact(
@@ -300,23 +913,46 @@ async def _emit_download_artifact(
     for key, value in media_metadata.items():
         rows.append((key.replace("_", " ").title(), value or "-"))
 
-    markdown_rows = "\n".join(f"| {field} | {value} |" for field, value in rows)
-    markdown_table = f"| {' | '.join(headers)} |\n| --- | --- |\n{markdown_rows}"
+    markdown = "\n".join(
+        [
+            "## Cobalt Download",
+            f"| {' | '.join(headers)} |",
+            "| --- | --- |",
+            *[f"| {field} | {value} |" for field, value in rows],
+        ]
+    )
 
     await create_markdown_artifact(
         key=f"download-{task_id}",
-        markdown=f"## Cobalt Download\n{markdown_table}",
+        markdown=markdown,
         description="Metadata for downloaded video asset.",
     )
 
 
 def _resolve_bucket_endpoint(bucket) -> Optional[str]:
+    key = id(bucket)
+    cached = _BUCKET_ENDPOINTS.get(key)
+    if cached is not None and cached[0]() is bucket:
+        return cached[1]
+
     try:
         params = bucket.credentials.aws_client_parameters.get_params_override()
-        return params.get("endpoint_url")
+        endpoint_url = params.get("endpoint_url")
     except AttributeError:
         return None
 
-
-__all__ = ["download_video_asset", "CobaltDownloadError"]
+    try:
+        ref = weakref.ref(bucket, lambda _ref: _BUCKET_ENDPOINTS.pop(key, None))
+    except TypeError:
+        return endpoint_url
+    _BUCKET_ENDPOINTS[key] = (ref, endpoint_url)
+    return endpoint_url
+
+
+__all__ = [
+    "download_video_asset",
+    "download_video_assets",
+    "http_client_session",
+    "CobaltDownloadError",
+]
 
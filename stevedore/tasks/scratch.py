@@ -0,0 +1,33 @@
+"""Scratch-space selection for tasks that stage media on local storage."""
+
+from __future__ import annotations
+
+import os
+import shutil
+from typing import Optional
+
+
+# ``STEVEDORE_TMP`` overrides the scratch location; otherwise tmpfs is used when
+# it has room so staged media never touches disk.
+_TMP_ROOT = os.environ.get("STEVEDORE_TMP")
+_SHM_ROOT = "/dev/shm"
+
+
+def scratch_root(expected_size: Optional[int]) -> Optional[str]:
+    """Return the parent directory for scratch files, or ``None`` for the default.
+
+    ``/dev/shm`` is only chosen when it has room for twice the expected size,
+    since containers often mount a small tmpfs there.
+    """
+
+    if _TMP_ROOT:
+        return _TMP_ROOT
+    if expected_size is None or not os.path.isdir(_SHM_ROOT):
+        return None
+
+    try:
+        free_bytes = shutil.disk_usage(_SHM_ROOT).free
+    except OSError:
+        return None
+
+    return _SHM_ROOT if free_bytes > expected_size * 2 else None
@@ -0,0 +1,41 @@
+"""Tests for shared block loading."""
+
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+
+from stevedore.blocks import MinIOBucket, load_block, loading, warm_block
+
+
+@pytest.fixture(autouse=True)
+def clear_blocks():
+    loading._BLOCKS.clear()
+    yield
+    loading._BLOCKS.clear()
+
+
+@pytest.mark.asyncio
+async def test_warm_block_shares_the_loaded_block(monkeypatch):
+    block = SimpleNamespace(warmup=AsyncMock())
+    block_load = AsyncMock(return_value=block)
+    monkeypatch.setattr(MinIOBucket, "load", block_load)
+
+    async with warm_block(MinIOBucket, "minio"):
+        assert await load_block(MinIOBucket, "minio") is block
+        await asyncio.sleep(0)
+
+    block_load.assert_awaited_once_with("minio")
+    block.warmup.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_warm_block_ignores_warmup_failures(monkeypatch):
+    block = SimpleNamespace(warmup=AsyncMock(side_effect=ConnectionError("unreachable")))
+    monkeypatch.setattr(MinIOBucket, "load", AsyncMock(return_value=block))
+
+    async with warm_block(MinIOBucket, "minio"):
+        await asyncio.sleep(0)
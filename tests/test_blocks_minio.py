@@ -0,0 +1,148 @@
+"""Tests for the MinIOBucket block helpers."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+from types import SimpleNamespace
+
+import pytest
+from botocore.exceptions import ClientError
+
+from stevedore.blocks import MinIOBucket
+
+
+class DummyS3Client:
+    def __init__(self, keys, page_size=2):
+        self.keys = sorted(keys)
+        self.page_size = page_size
+        self.list_calls = []
+        self.head_calls = []
+
+    def head_object(self, Bucket, Key):
+        self.head_calls.append(Key)
+        if Key not in self.keys:
+            raise ClientError(
+                {"Error": {"Code": "404"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+                "HeadObject",
+            )
+        return {"ContentLength": 1}
+
+    def list_objects_v2(self, Bucket, Prefix, StartAfter="", ContinuationToken=None):
+        self.list_calls.append({"Prefix": Prefix, "StartAfter": StartAfter})
+        start = int(ContinuationToken or 0)
+        matching = [key for key in self.keys if key.startswith(Prefix) and key > StartAfter]
+        page = matching[start : start + self.page_size]
+        truncated = start + self.page_size < len(matching)
+        response = {"Contents": [{"Key": key} for key in page], "IsTruncated": truncated}
+        if truncated:
+            response["NextContinuationToken"] = str(start + self.page_size)
+        return response
+
+
+class DummyMultipartClient:
+    def __init__(self, fail_part=None):
+        self.fail_part = fail_part
+        self.parts = {}
+        self.part_uploaded = threading.Event()
+        self.completed = False
+        self.aborted = False
+
+    def create_multipart_upload(self, Bucket, Key):
+        return {"UploadId": "upload"}
+
+    def upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        if PartNumber == self.fail_part:
+            raise RuntimeError("part failed")
+        self.parts[PartNumber] = Body
+        self.part_uploaded.set()
+        return {"ETag": f"etag-{PartNumber}"}
+
+    def complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        self.completed = True
+
+    def abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.aborted = True
+
+
+def _bucket_config(client):
+    bucket = SimpleNamespace(
+        bucket_name="bucket",
+        _resolve_path=lambda key: key,
+        _get_s3_client=lambda: client,
+    )
+    bucket_config = MinIOBucket.model_construct(bucket_block_name="s3")
+    bucket_config._cached_bucket = bucket
+    return bucket_config
+
+
+@pytest.mark.asyncio
+async def test_objects_exist_lists_only_the_key_range_of_each_prefix():
+    stored = [f"task-{n}/download/video-{i}.mp4" for n in range(3) for i in range(10)]
+    client = DummyS3Client(stored)
+    bucket_config = _bucket_config(client)
+
+    keys = [
+        "task-1/download/video-3.mp4",
+        "task-1/download/video-5.mp4",
+        "task-1/download/video-4.mp4x",
+        "task-2/download/video-7.mp4",
+        "task-9/download/video-0.mp4",
+    ]
+
+    assert await bucket_config.objects_exist(keys) == {
+        "task-1/download/video-3.mp4": True,
+        "task-1/download/video-5.mp4": True,
+        "task-1/download/video-4.mp4x": False,
+        "task-2/download/video-7.mp4": True,
+        "task-9/download/video-0.mp4": False,
+    }
+
+    # Keys under other task IDs are never listed; lone keys are HEADed instead.
+    assert {call["Prefix"] for call in client.list_calls} == {"task-1/download/video-"}
+    assert len(client.list_calls) <= 2
+    assert sorted(client.head_calls) == [
+        "task-2/download/video-7.mp4",
+        "task-9/download/video-0.mp4",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_aborts_when_cancelled():
+    client = DummyMultipartClient()
+    bucket_config = _bucket_config(client)
+    stalled = asyncio.Event()
+
+    async def chunks():
+        yield b"a" * 4
+        await stalled.wait()
+
+    upload = asyncio.ensure_future(bucket_config.upload_stream("video.mp4", chunks(), part_size=4))
+    await asyncio.to_thread(client.part_uploaded.wait, 5)
+    upload.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await upload
+    assert client.aborted
+    assert not client.completed
+
+
+@pytest.mark.asyncio
+async def test_upload_stream_stops_reading_after_a_part_fails():
+    client = DummyMultipartClient(fail_part=1)
+    bucket_config = _bucket_config(client)
+    consumed = 0
+
+    async def chunks():
+        nonlocal consumed
+        for _ in range(10):
+            consumed += 1
+            yield b"a" * 4
+
+    with pytest.raises(RuntimeError, match="part failed"):
+        await bucket_config.upload_stream("video.mp4", chunks(), part_size=4, max_concurrency=1)
+
+    # The second part waits for the failed first one and raises its error.
+    assert consumed == 2
+    assert client.aborted
+    assert not client.completed
@@ -0,0 +1,62 @@
+"""Tests for the CLI operations."""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+from unittest.mock import AsyncMock
+
+import pytest
+from prefect.exceptions import ObjectAlreadyExists
+
+from stevedore.cli import operations
+
+BASE_JOB_TEMPLATE = {"job_configuration": {}, "variables": {"properties": {}}}
+
+
+@pytest.fixture
+def prefect_client(monkeypatch):
+    client = AsyncMock()
+
+    @asynccontextmanager
+    async def get_client():
+        yield client
+
+    monkeypatch.setattr(operations, "get_client", get_client)
+    async def default_template(pool_type):
+        return BASE_JOB_TEMPLATE if pool_type == "docker" else None
+
+    monkeypatch.setattr(
+        operations,
+        "get_default_base_job_template_for_infrastructure_type",
+        default_template,
+    )
+    return client
+
+
+@pytest.mark.parametrize("overwrite", [False, True])
+def test_ensure_work_pool_creates_pool_with_default_template(prefect_client, capsys, overwrite):
+    operations.ensure_work_pool("downloads", "docker", overwrite=overwrite)
+
+    work_pool = prefect_client.create_work_pool.await_args.args[0]
+    assert work_pool.name == "downloads"
+    assert work_pool.type == "docker"
+    assert work_pool.base_job_template == BASE_JOB_TEMPLATE
+    assert prefect_client.create_work_pool.await_args.kwargs == {"overwrite": overwrite}
+    assert "Work pool 'downloads' (docker) is ready." in capsys.readouterr().out
+
+
+def test_ensure_work_pool_reports_existing_pool(prefect_client, capsys):
+    prefect_client.create_work_pool.side_effect = ObjectAlreadyExists(None)
+
+    operations.ensure_work_pool("downloads", "docker")
+
+    out = capsys.readouterr().out
+    assert "already exists. Use --overwrite to update." in out
+    assert "is ready" not in out
+
+
+def test_ensure_work_pool_rejects_unknown_type(prefect_client):
+    with pytest.raises(ValueError, match="Unknown work pool type 'nope'"):
+        operations.ensure_work_pool("downloads", "nope")
+
+    prefect_client.create_work_pool.assert_not_awaited()
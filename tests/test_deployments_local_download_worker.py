@@ -0,0 +1,33 @@
+"""Tests for the local download worker deployment manifest loading."""
+
+from __future__ import annotations
+
+import os
+
+import pytest
+
+from stevedore.deployments import local_download_worker
+
+
+@pytest.fixture(autouse=True)
+def clear_manifest_cache():
+    local_download_worker._YAML_CACHE.clear()
+    yield
+    local_download_worker._YAML_CACHE.clear()
+
+
+def test_load_manifest_reuses_parse_until_the_file_changes(tmp_path):
+    manifest = tmp_path / "manifest.yaml"
+    manifest.write_text("deployments:\n  - name: first\n")
+
+    first = local_download_worker._load_manifest(manifest)
+    assert first == {"deployments": [{"name": "first"}]}
+    assert local_download_worker._load_manifest(manifest) is first
+
+    manifest.write_text("deployments:\n  - name: second\n")
+    stat = manifest.stat()
+    os.utime(manifest, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    reloaded = local_download_worker._load_manifest(manifest)
+    assert reloaded == {"deployments": [{"name": "second"}]}
+    assert local_download_worker._load_manifest(manifest) is reloaded
@@ -0,0 +1,256 @@
+"""Tests for the audio extraction task and flow."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from botocore.exceptions import ClientError
+
+from stevedore.blocks import loading
+from stevedore.flows.audio_extraction_flow import audio_extraction_flow
+from stevedore.tasks.audio import AudioExtractionError, _extract_cache_key, extract_audio_asset
+
+
+@pytest.fixture(autouse=True)
+def clear_blocks():
+    loading._BLOCKS.clear()
+    yield
+    loading._BLOCKS.clear()
+
+
+PRESIGNED_URL = "http://minio.test/bucket/task-123/download/video.mp4?X-Amz-Signature=secret"
+
+
+class FakeFFmpeg:
+    def __init__(self, returncode=0, stderr=b"", hang=False):
+        self.returncode = None
+        self._exit_code = returncode
+        self._stderr = stderr
+        self._hang = hang
+        self.command = None
+        self.killed = False
+
+    async def create_subprocess_exec(self, *command, **kwargs):
+        self.command = list(command)
+        return self
+
+    async def communicate(self):
+        if self._hang:
+            await asyncio.Event().wait()
+        if self._exit_code == 0:
+            with open(self.command[-1], "wb") as output:
+                output.write(b"audio")
+        self.returncode = self._exit_code
+        return b"", self._stderr
+
+    def kill(self):
+        self.killed = True
+        self.returncode = -9
+
+    async def wait(self):
+        return self.returncode
+
+
+@pytest.fixture
+def audio_env(monkeypatch, tmp_path):
+    uploads = {}
+
+    async def aupload_from_path(from_path, to_path):
+        uploads[to_path] = from_path.read_bytes()
+        return to_path
+
+    s3_bucket = SimpleNamespace(aupload_from_path=aupload_from_path)
+    bucket_config = SimpleNamespace(
+        bucket_path_prefix=None,
+        load_bucket=AsyncMock(return_value=s3_bucket),
+        head_object=AsyncMock(return_value={"ContentLength": 5, "ETag": '"audio-etag"'}),
+        presigned_url=AsyncMock(return_value=PRESIGNED_URL),
+    )
+    scratch_sizes = []
+
+    def scratch_root(expected_size):
+        scratch_sizes.append(expected_size)
+        return str(tmp_path)
+
+    monkeypatch.setattr(
+        "stevedore.tasks.audio.MinIOBucket.load", AsyncMock(return_value=bucket_config)
+    )
+    monkeypatch.setattr("stevedore.tasks.audio.scratch_root", scratch_root)
+    monkeypatch.setattr("stevedore.tasks.audio.get_run_logger", logging.getLogger)
+    monkeypatch.setattr("stevedore.tasks.audio.create_markdown_artifact", AsyncMock())
+
+    def install(ffmpeg):
+        monkeypatch.setattr(
+            "stevedore.tasks.audio.asyncio.create_subprocess_exec",
+            ffmpeg.create_subprocess_exec,
+        )
+
+    return SimpleNamespace(
+        bucket_config=bucket_config,
+        uploads=uploads,
+        scratch_sizes=scratch_sizes,
+        scratch_dir=tmp_path,
+        install=install,
+    )
+
+
+def _extract(**kwargs):
+    return extract_audio_asset.fn(
+        source_object_path="task-123/download/video.mp4",
+        task_id="task-123",
+        minio_bucket_block="minio",
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_extract_audio_asset_streams_presigned_url_into_scratch(audio_env):
+    ffmpeg = FakeFFmpeg()
+    audio_env.install(ffmpeg)
+
+    result = await _extract(source_etag='"source-etag"', source_size=2048)
+
+    assert result == "task-123/extract-audio/video.audio.mka"
+    assert audio_env.uploads == {result: b"audio"}
+    output_path = ffmpeg.command[-1]
+    assert ffmpeg.command == [
+        "ffmpeg",
+        "-nostdin",
+        "-hide_banner",
+        "-loglevel",
+        "error",
+        "-threads",
+        "1",
+        "-y",
+        "-i",
+        PRESIGNED_URL,
+        "-map",
+        "0:a:0",
+        "-c:a",
+        "copy",
+        "-threads",
+        "1",
+        output_path,
+    ]
+    # Scratch space is sized from the flow's HEAD, so the source is not HEADed
+    # again; only the uploaded audio is.
+    assert audio_env.scratch_sizes == [2048]
+    assert output_path.startswith(str(audio_env.scratch_dir))
+    audio_env.bucket_config.head_object.assert_awaited_once()
+    assert audio_env.bucket_config.head_object.await_args.args == (result,)
+    assert not list(audio_env.scratch_dir.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_extract_audio_asset_redacts_presigned_url_from_errors(audio_env):
+    audio_env.install(
+        FakeFFmpeg(returncode=1, stderr=f"{PRESIGNED_URL}: Invalid data found".encode())
+    )
+
+    with pytest.raises(AudioExtractionError) as excinfo:
+        await _extract()
+
+    message = str(excinfo.value)
+    assert "exit code 1" in message
+    assert "task-123/download/video.mp4: Invalid data found" in message
+    assert "X-Amz-Signature" not in message
+    assert not audio_env.uploads
+    assert not list(audio_env.scratch_dir.iterdir())
+
+
+@pytest.mark.asyncio
+async def test_extract_audio_asset_kills_ffmpeg_when_cancelled(audio_env):
+    ffmpeg = FakeFFmpeg(hang=True)
+    audio_env.install(ffmpeg)
+
+    extraction = asyncio.ensure_future(_extract(source_etag='"source-etag"', source_size=2048))
+    while ffmpeg.command is None:
+        await asyncio.sleep(0)
+    await asyncio.sleep(0)
+    extraction.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await extraction
+    assert ffmpeg.killed
+    assert not list(audio_env.scratch_dir.iterdir())
+
+
+def test_extract_cache_key_requires_and_covers_source_etag():
+    context = SimpleNamespace(task=extract_audio_asset)
+    parameters = {
+        "source_object_path": "task-123/download/video.mp4",
+        "task_id": "task-123",
+        "minio_bucket_block": "minio",
+        "object_name": None,
+    }
+
+    assert _extract_cache_key(context, {**parameters, "source_etag": None}) is None
+
+    first = _extract_cache_key(context, {**parameters, "source_etag": '"etag-1"'})
+    second = _extract_cache_key(context, {**parameters, "source_etag": '"etag-2"'})
+    assert first and second and first != second
+
+
+@pytest.mark.asyncio
+async def test_audio_extraction_flow_passes_source_etag(monkeypatch):
+    bucket_config = SimpleNamespace(
+        head_object=AsyncMock(return_value={"ETag": '"source-etag"', "ContentLength": 5}),
+    )
+    bucket_load = AsyncMock(return_value=bucket_config)
+    extract_mock = AsyncMock(return_value="task-123/extract-audio/video.audio.mka")
+
+    monkeypatch.setattr("stevedore.flows.audio_extraction_flow.MinIOBucket.load", bucket_load)
+    monkeypatch.setattr("stevedore.flows.audio_extraction_flow.extract_audio_asset", extract_mock)
+    monkeypatch.setattr(
+        "stevedore.flows.audio_extraction_flow.get_run_logger", logging.getLogger
+    )
+
+    result = await audio_extraction_flow.fn(
+        source_object_path="task-123/download/video.mp4",
+        task_id="task-123",
+        minio_bucket_block="minio",
+    )
+
+    assert result == "task-123/extract-audio/video.audio.mka"
+    bucket_load.assert_awaited_once_with("minio")
+    bucket_config.head_object.assert_awaited_once_with("task-123/download/video.mp4")
+    assert extract_mock.await_args.kwargs["source_etag"] == '"source-etag"'
+    assert extract_mock.await_args.kwargs["source_size"] == 5
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("status", [404, 403])
+async def test_audio_extraction_flow_skips_caching_only_for_missing_source(monkeypatch, status):
+    error = ClientError(
+        {"Error": {"Code": str(status)}, "ResponseMetadata": {"HTTPStatusCode": status}},
+        "HeadObject",
+    )
+    bucket_config = SimpleNamespace(head_object=AsyncMock(side_effect=error))
+    extract_mock = AsyncMock(return_value="task-123/extract-audio/video.audio.mka")
+
+    monkeypatch.setattr(
+        "stevedore.flows.audio_extraction_flow.MinIOBucket.load",
+        AsyncMock(return_value=bucket_config),
+    )
+    monkeypatch.setattr("stevedore.flows.audio_extraction_flow.extract_audio_asset", extract_mock)
+    monkeypatch.setattr(
+        "stevedore.flows.audio_extraction_flow.get_run_logger", logging.getLogger
+    )
+
+    call = audio_extraction_flow.fn(
+        source_object_path="task-123/download/video.mp4",
+        task_id="task-123",
+        minio_bucket_block="minio",
+    )
+
+    if status == 404:
+        await call
+        assert extract_mock.await_args.kwargs["source_etag"] is None
+    else:
+        with pytest.raises(ClientError):
+            await call
+        extract_mock.assert_not_awaited()
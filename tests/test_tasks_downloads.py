@@ -2,29 +2,63 @@
 
 from __future__ import annotations
 
+import asyncio
+import os
+import threading
 from types import SimpleNamespace
 from unittest.mock import AsyncMock
 from pathlib import Path
 
+import httpx
+import orjson
 import pytest
 
+from stevedore.blocks import MinIOBucket, loading
+from stevedore.tasks import downloads
 from stevedore.tasks.downloads import (
     CobaltDownloadError,
     download_video_asset,
+    download_video_assets,
+    http_client_session,
 )
 from botocore.exceptions import ClientError
 
 
+@pytest.fixture(autouse=True)
+def clear_caches(monkeypatch, tmp_path):
+    # Keep the ffprobe disk cache out of the real home directory.
+    monkeypatch.setattr(downloads, "_PROBE_CACHE_DIR", tmp_path / "ffprobe-cache")
+    monkeypatch.setattr(downloads, "_PROBE_CACHE_FILES", None)
+    downloads._HEAD_CACHE.clear()
+    downloads._PROBE_CACHE.clear()
+    loading._BLOCKS.clear()
+    yield
+    downloads._HEAD_CACHE.clear()
+    downloads._PROBE_CACHE.clear()
+    loading._BLOCKS.clear()
+
+
 class DummyS3Bucket:
     def __init__(self):
         self.objects: dict[str, bytes] = {}
+        self.uploads: dict[str, dict[int, bytes]] = {}
+        self.metadata: dict[str, dict[str, str]] = {}
         self.bucket_name = "bucket"
+        self.complete_gate: threading.Event | None = None
+        self.complete_gate_opened: bool | None = None
 
     def _resolve_path(self, key):
         return key
 
     def _get_s3_client(self):
-        return SimpleNamespace(head_object=self._head_object)
+        return SimpleNamespace(
+            head_object=self._head_object,
+            create_multipart_upload=self._create_multipart_upload,
+            upload_part=self._upload_part,
+            complete_multipart_upload=self._complete_multipart_upload,
+            abort_multipart_upload=self._abort_multipart_upload,
+            copy_object=self._copy_object,
+        )
 
     async def aread_path(self, key):
         return self.objects[key]
@@ -36,17 +70,62 @@ class DummyS3Bucket:
 
     def _head_object(self, Bucket, Key):
         if Key not in self.objects:
-            raise ClientError({"Error": {"Code": "404"}}, "HeadObject")
+            raise ClientError(
+                {"Error": {"Code": "404"}, "ResponseMetadata": {"HTTPStatusCode": 404}},
+                "HeadObject",
+            )
 
         return {
             "ContentLength": len(self.objects[Key]),
             "ETag": "\"dummy-etag\"",
             "LastModified": "2024-01-01T00:00:00Z",
+            "Metadata": dict(self.metadata.get(Key, {})),
         }
 
+    def _copy_object(self, Bucket, Key, CopySource, Metadata, MetadataDirective):
+        assert CopySource == {"Bucket": Bucket, "Key": Key}
+        assert MetadataDirective == "REPLACE"
+        self.metadata[Key] = dict(Metadata)
+        return {"CopyObjectResult": {"ETag": "\"copied-etag\""}}
+
+    def _create_multipart_upload(self, Bucket, Key):
+        self.uploads[Key] = {}
+        return {"UploadId": Key}
+
+    def _upload_part(self, Bucket, Key, UploadId, PartNumber, Body):
+        self.uploads[UploadId][PartNumber] = Body
+        return {"ETag": f"part-{PartNumber}"}
+
+    def _complete_multipart_upload(self, Bucket, Key, UploadId, MultipartUpload):
+        if self.complete_gate is not None:
+            self.complete_gate_opened = self.complete_gate.wait(timeout=5)
+        parts = self.uploads.pop(UploadId)
+        self.objects[Key] = b"".join(
+            parts[part["PartNumber"]] for part in MultipartUpload["Parts"]
+        )
+
+    def _abort_multipart_upload(self, Bucket, Key, UploadId):
+        self.uploads.pop(UploadId, None)
+
+
+class DummyStream:
+    def __init__(self, chunks, headers=None):
+        self.chunks = chunks
+        self.headers = headers or {}
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    def raise_for_status(self):
+        return None
 
-async def _object_exists(dummy_bucket, key, bucket=None):
-    return key in dummy_bucket.objects
+    async def aiter_bytes(self, chunk_size=None):
+        assert chunk_size is not None and chunk_size >= 64 * 1024
+        for chunk in self.chunks:
+            yield chunk
 
 
 async def _head_object(dummy_bucket, key, bucket=None):
@@ -55,14 +134,21 @@ async def _head_object(dummy_bucket, key, bucket=None):
 
 
 @pytest.mark.asyncio
-async def test_download_video_asset_skips_when_object_exists(monkeypatch, tmp_path):
+@pytest.mark.parametrize("stored_probe", [False, True])
+async def test_download_video_asset_skips_when_object_exists(monkeypatch, tmp_path, stored_probe):
     dummy_bucket = DummyS3Bucket()
     dummy_bucket.objects["task-123/download/videos/video.mp4"] = b"dummy"
+    if stored_probe:
+        dummy_bucket.metadata["task-123/download/videos/video.mp4"] = {
+            "probe-resolution": "1920x1080",
+        }
     dummy_cobalt_response = {"status": "redirect", "url": "http://download.test/video"}
 
     class DummyCobaltClient:
+        instances = 0
+
         def __init__(self, *args, **kwargs):
-            pass
+            DummyCobaltClient.instances += 1
 
         async def __aenter__(self):
             return self
@@ -70,68 +156,52 @@ async def test_download_video_asset_skips_when_object_exists(monkeypatch, tmp_pa
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
+        _response = SimpleNamespace(
+            raise_for_status=lambda: None,
+            content=orjson.dumps(dummy_cobalt_response),
+        )
+        _stream = DummyStream([b"dummy"])
+
         async def post(self, *args, **kwargs):
-            return SimpleNamespace(
-                raise_for_status=lambda: None,
-                json=lambda: dummy_cobalt_response,
-            )
+            return self._response
 
-        def stream(self, method, url):
+        def stream(self, method, url, **kwargs):
             assert method == "GET"
             assert url == dummy_cobalt_response["url"]
-
-            class DummyStream:
-                async def __aenter__(self):
-                    return self
-
-                async def __aexit__(self, exc_type, exc, tb):
-                    return False
-
-                def raise_for_status(self):
-                    return None
-
-                async def aiter_bytes(self):
-                    yield b"dummy"
-
-            return DummyStream()
+            return self._stream
 
     monkeypatch.setattr(
         "stevedore.tasks.downloads.httpx.AsyncClient",
         DummyCobaltClient,
     )
 
-    monkeypatch.setattr(
-        "stevedore.tasks.downloads.CobaltSettings.load",
-        classmethod(
-            lambda cls, name: SimpleNamespace(
-                base_url="http://cobalt.test",
-                request_timeout_seconds=5,
-                download_timeout_seconds=5,
-                headers=lambda: {"Content-Type": "application/json"},
-            )
-        ),
+    cobalt_load = AsyncMock(
+        return_value=SimpleNamespace(
+            base_url="http://cobalt.test",
+            request_timeout_seconds=5,
+            download_timeout_seconds=5,
+            headers=lambda: {"Content-Type": "application/json"},
+        )
     )
+    monkeypatch.setattr("stevedore.tasks.downloads.CobaltSettings.load", cobalt_load)
 
     gather_mock = AsyncMock(return_value={"resolution": "1920x1080"})
     artifact_mock = AsyncMock()
 
     monkeypatch.setattr("stevedore.tasks.downloads._gather_media_metadata", gather_mock)
     monkeypatch.setattr("stevedore.tasks.downloads.create_markdown_artifact", artifact_mock)
-    monkeypatch.setattr(
-        "stevedore.tasks.downloads.MinIOBucket.load",
-        classmethod(
-            lambda cls, name: SimpleNamespace(
-                bucket_path_prefix="videos",
-                load_bucket=AsyncMock(return_value=dummy_bucket),
-                object_exists=lambda key, bucket=None: _object_exists(dummy_bucket, key, bucket),
-                head_object=lambda key, bucket=None: _head_object(dummy_bucket, key, bucket),
-            )
-        ),
+    bucket_load = AsyncMock(
+        return_value=SimpleNamespace(
+            bucket_path_prefix="videos",
+            load_bucket=AsyncMock(return_value=dummy_bucket),
+            head_object=lambda key, bucket=None: _head_object(dummy_bucket, key, bucket),
+        )
     )
+    monkeypatch.setattr("stevedore.tasks.downloads.MinIOBucket.load", bucket_load)
 
     monkeypatch.setattr(
         "stevedore.tasks.downloads.tempfile.mkdtemp",
-        lambda prefix: str(tmp_path),
+        lambda prefix, dir=None: str(tmp_path),
     )
 
     result = await download_video_asset.fn(
@@ -143,14 +213,42 @@ async def test_download_video_asset_skips_when_object_exists(monkeypatch, tmp_pa
     )
 
     assert result == "task-123/download/videos/video.mp4"
-    gather_mock.assert_awaited()
+    if stored_probe:
+        gather_mock.assert_not_awaited()
+    else:
+        gather_mock.assert_awaited()
+        assert gather_mock.await_args.kwargs["head_metadata"]["ETag"] == "\"dummy-etag\""
     artifact_mock.assert_awaited()
+    markdown = artifact_mock.await_args.kwargs["markdown"]
+    assert "| S3 Object Size | 5 bytes |" in markdown
+    assert "| Resolution | 1920x1080 |" in markdown
+    assert "| ETag | \"dummy-etag\" |" in markdown
+
+    # A second run in the same process reuses the loaded blocks and HTTP client.
+    await download_video_asset.fn(
+        source_url="http://example.com/video",
+        task_id="task-123",
+        cobalt_settings_block="cobalt",
+        minio_bucket_block="minio",
+        object_name="video.mp4",
+    )
+    cobalt_load.assert_awaited_once_with("cobalt")
+    bucket_load.assert_awaited_once_with("minio")
+    assert DummyCobaltClient.instances == 1
 
 
 @pytest.mark.asyncio
-async def test_download_video_asset_success(monkeypatch, tmp_path):
+@pytest.mark.parametrize(
+    ("accept_ranges", "head_fails"), [(False, False), (True, False), (False, True)]
+)
+async def test_download_video_asset_success(monkeypatch, tmp_path, accept_ranges, head_fails):
     dummy_bucket = DummyS3Bucket()
     dummy_cobalt_response = {"status": "redirect", "url": "http://download.test/video"}
+    # A failed HEAD falls back to a plain GET of the URL Cobalt returned.
+    resolved_url = (
+        dummy_cobalt_response["url"] if head_fails else "http://cdn.test/video?signature=abc"
+    )
+    video_bytes = b"dummyvideo"
 
     class DummyCobaltClient:
         def __init__(self, *args, **kwargs):
@@ -162,12 +260,54 @@ async def test_download_video_asset_success(monkeypatch, tmp_path):
         async def __aexit__(self, exc_type, exc, tb):
             return False
 
+        _response = SimpleNamespace(
+            raise_for_status=lambda: None,
+            content=orjson.dumps(dummy_cobalt_response),
+        )
+        _stream = DummyStream(
+            [b"dummy", b"video"],
+            headers={"content-length": str(len(video_bytes))},
+        )
+
         async def post(self, *args, **kwargs):
+            return self._response
+
+        _head_response = SimpleNamespace(
+            status_code=200,
+            headers={
+                "content-length": str(len(video_bytes)),
+                **({"accept-ranges": "bytes"} if accept_ranges else {}),
+            },
+            url=resolved_url,
+        )
+
+        async def head(self, url, **kwargs):
+            assert url == dummy_cobalt_response["url"]
+            assert kwargs["follow_redirects"] is True
+            if head_fails:
+                raise httpx.ConnectError("connection dropped")
+            return self._head_response
+
+        async def get(self, url, headers, **kwargs):
+            assert url == resolved_url
+            start, end = map(int, headers["Range"].removeprefix("bytes=").split("-"))
             return SimpleNamespace(
+                status_code=206,
                 raise_for_status=lambda: None,
-                json=lambda: dummy_cobalt_response,
+                content=video_bytes[start : end + 1],
             )
 
+        def stream(self, method, url, **kwargs):
+            assert not accept_ranges
+            assert method == "GET"
+            assert url == resolved_url
+            return self._stream
+
+    monkeypatch.setattr("stevedore.tasks.downloads._RANGE_CHUNK_BYTES", 4)
+
+    bucket_config = MinIOBucket.model_construct(bucket_block_name="s3", bucket_path_prefix=None)
+    bucket_config._cached_bucket = dummy_bucket
+
     monkeypatch.setattr(
         "stevedore.tasks.downloads.httpx.AsyncClient",
         DummyCobaltClient,
@@ -175,8 +315,8 @@ async def test_download_video_asset_success(monkeypatch, tmp_path):
 
     monkeypatch.setattr(
         "stevedore.tasks.downloads.CobaltSettings.load",
-        classmethod(
-            lambda cls, name: SimpleNamespace(
+        AsyncMock(
+            return_value=SimpleNamespace(
                 base_url="http://cobalt.test",
                 request_timeout_seconds=5,
                 download_timeout_seconds=5,
@@ -185,24 +325,176 @@ async def test_download_video_asset_success(monkeypatch, tmp_path):
         ),
     )
 
-    gather_mock = AsyncMock(return_value={"resolution": "1920x1080"})
     artifact_mock = AsyncMock()
 
-    monkeypatch.setattr("stevedore.tasks.downloads._gather_media_metadata", gather_mock)
     monkeypatch.setattr("stevedore.tasks.downloads.create_markdown_artifact", artifact_mock)
+    # The dummy completion blocks until ffprobe has started, so the test only
+    # passes when probing overlaps the upload.
+    probe_started = threading.Event()
+    dummy_bucket.complete_gate = probe_started
+
+    async def run_ffprobe(path):
+        assert path.read_bytes() == video_bytes
+        probe_started.set()
+        return orjson.dumps({"streams": [{"codec_name": "h264", "width": 1920, "height": 1080}]})
+
+    monkeypatch.setattr("stevedore.tasks.downloads._run_ffprobe", run_ffprobe)
     monkeypatch.setattr(
         "stevedore.tasks.downloads.MinIOBucket.load",
-        classmethod(
-            lambda cls, name: SimpleNamespace(
+        AsyncMock(return_value=bucket_config),
+    )
+
+    download_dir = tmp_path / "download"
+    download_dir.mkdir()
+    spool_dirs = []
+
+    def mkdtemp(prefix, dir=None):
+        spool_dirs.append(dir)
+        return str(download_dir)
+
+    monkeypatch.setattr("stevedore.tasks.downloads.tempfile.mkdtemp", mkdtemp)
+    monkeypatch.setattr(
+        "stevedore.tasks.downloads.scratch_root",
+        lambda expected_size: f"/spool/{expected_size}",
+    )
+
+    result = await download_video_asset.fn(
+        source_url="http://example.com/video",
+        task_id="task-123",
+        cobalt_settings_block="cobalt",
+        minio_bucket_block="minio",
+    )
+
+    assert result == "task-123/download/video_task-123.mp4"
+    assert dummy_bucket.objects[result] == video_bytes
+    assert not dummy_bucket.uploads
+    assert dummy_bucket.complete_gate_opened
+    assert dummy_bucket.metadata[result] == {
+        "probe-codec": "h264",
+        "probe-resolution": "1920x1080",
+    }
+    markdown = artifact_mock.await_args.kwargs["markdown"]
+    assert "| ETag | \"copied-etag\" |" in markdown
+    # Probe fields live on the object, so nothing is cached under a stale ETag.
+    assert not downloads._PROBE_CACHE
+    assert not download_dir.exists()
+    assert spool_dirs == [f"/spool/{None if head_fails else len(video_bytes)}"]
+    artifact_mock.assert_awaited()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("size_bytes", [20, 6])
+async def test_download_probe_sample_writes_head_and_tail_at_their_offsets(
+    monkeypatch, tmp_path, size_bytes
+):
+    payload = bytes(range(1, size_bytes + 1))
+    requested = []
+
+    class RangeClient:
+        def get_object(self, Bucket, Key, Range):
+            requested.append(Range)
+            start, _, end = Range.removeprefix("bytes=").partition("-")
+            if not start:
+                data = payload[-int(end) :]
+            else:
+                data = payload[int(start) : int(end) + 1]
+            return {"Body": SimpleNamespace(read=lambda: data)}
+
+    bucket = SimpleNamespace(
+        bucket_name="bucket",
+        _resolve_path=lambda key: key,
+        _get_s3_client=lambda: RangeClient(),
+    )
+    bucket_config = MinIOBucket.model_construct(bucket_block_name="s3")
+    bucket_config._cached_bucket = bucket
+    monkeypatch.setattr("stevedore.tasks.downloads._PROBE_SAMPLE_BYTES", 4)
+
+    path = tmp_path / "sample.mp4"
+    await downloads._download_probe_sample(
+        bucket_config, "video.mp4", bucket=bucket, size_bytes=size_bytes, path=path
+    )
+
+    sample = path.read_bytes()
+    assert len(sample) == size_bytes
+    if size_bytes > 8:
+        assert sorted(requested) == ["bytes=-4", "bytes=0-3"]
+        assert sample == payload[:4] + bytes(size_bytes - 8) + payload[-4:]
+    else:
+        assert requested == ["bytes=0-7"]
+        assert sample == payload
+
+
+@pytest.mark.asyncio
+async def test_probe_cache_prunes_least_recently_used_files_past_the_limit(monkeypatch):
+    monkeypatch.setattr("stevedore.tasks.downloads._PROBE_CACHE_MAX_FILES", 4)
+    monkeypatch.setattr("stevedore.tasks.downloads._PROBE_CACHE", downloads.LRUCache(maxsize=2))
+    list_files = downloads._list_probe_cache_files
+    listings = []
+
+    def counting_list_files():
+        listings.append(1)
+        return list_files()
+
+    monkeypatch.setattr("stevedore.tasks.downloads._list_probe_cache_files", counting_list_files)
+
+    for index, etag in enumerate(["a", "b", "c", "d"]):
+        await downloads._write_probe_cache(etag, etag.encode())
+        os.utime(downloads._probe_cache_file(etag), (index, index))
+
+    downloads._PROBE_CACHE.clear()
+    assert await downloads._read_probe_cache("a") == b"a"
+    await downloads._write_probe_cache("e", b"e")
+
+    # Crossing the limit prunes down to three quarters of it, oldest first.
+    assert sorted(path.name for path in downloads._PROBE_CACHE_DIR.iterdir()) == sorted(
+        downloads._probe_cache_file(etag).name for etag in ["a", "d", "e"]
+    )
+    assert list(downloads._PROBE_CACHE.keys()) == ["a", "e"]
+    # The directory is listed once to seed the count and once to prune.
+    assert len(listings) == 2
+
+
+@pytest.mark.asyncio
+async def test_download_video_asset_raises_on_cobalt_error(monkeypatch):
+    class DummyCobaltClient:
+        def __init__(self, *args, **kwargs):
+            pass
+
+        _response = SimpleNamespace(
+            raise_for_status=lambda: None,
+            content=orjson.dumps({"status": "error", "error": "unsupported"}),
+        )
+
+        async def post(self, *args, **kwargs):
+            return self._response
+
+    monkeypatch.setattr(
+        "stevedore.tasks.downloads.httpx.AsyncClient",
+        DummyCobaltClient,
+    )
+
+    monkeypatch.setattr(
+        "stevedore.tasks.downloads.CobaltSettings.load",
+        AsyncMock(
+            return_value=SimpleNamespace(
+                base_url="http://cobalt.test",
+                request_timeout_seconds=5,
+                download_timeout_seconds=5,
+                headers=lambda: {"Content-Type": "application/json"},
+            )
+        ),
+    )
+    monkeypatch.setattr(
+        "stevedore.tasks.downloads.MinIOBucket.load",
+        AsyncMock(
+            return_value=SimpleNamespace(
                 bucket_path_prefix=None,
-                load_bucket=lambda: dummy_bucket,
-                object_exists=lambda key, bucket=None: _object_exists(dummy_bucket, key, bucket),
-                head_object=lambda key, bucket=None: _head_object(dummy_bucket, key, bucket),
+                load_bucket=AsyncMock(return_value=DummyS3Bucket()),
             )
         ),
     )
 
-    with pytest.raises(CobaltDownloadError):
+    with pytest.raises(CobaltDownloadError, match="unsupported"):
         await download_video_asset.fn(
             source_url="http://example.com/video",
             task_id="task-123",
@@ -210,3 +502,190 @@ async def test_download_video_asset_success(monkeypatch, tmp_path):
             minio_bucket_block="minio",
         )
 
+
+@pytest.mark.asyncio
+async def test_head_if_exists_caches_hits_only():
+    dummy_bucket = DummyS3Bucket()
+    head_mock = AsyncMock(
+        side_effect=lambda key, bucket=None: bucket._head_object(bucket.bucket_name, key)
+    )
+    bucket_config = SimpleNamespace(head_object=head_mock)
+
+    assert await downloads._head_if_exists(bucket_config, "video.mp4", bucket=dummy_bucket) is None
+    dummy_bucket.objects["video.mp4"] = b"dummy"
+
+    first = await downloads._head_if_exists(bucket_config, "video.mp4", bucket=dummy_bucket)
+    second = await downloads._head_if_exists(bucket_config, "video.mp4", bucket=dummy_bucket)
+
+    assert first == second == {
+        "ContentLength": 5,
+        "ETag": "\"dummy-etag\"",
+        "LastModified": "2024-01-01T00:00:00Z",
+        "Metadata": {},
+    }
+    assert head_mock.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_download_video_assets_bounds_concurrency(monkeypatch):
+    active = 0
+    peak = 0
+
+    async def fake_download(*, source_url, task_id, **kwargs):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.001)
+        active -= 1
+        return f"{task_id}/download/video.mp4"
+
+    monkeypatch.setattr("stevedore.tasks.downloads.download_video_asset", fake_download)
+
+    items = [
+        {
+            "source_url": f"http://example.com/video-{index}",
+            "task_id": f"task-{index}",
+            "cobalt_settings_block": "cobalt",
+            "minio_bucket_block": "minio",
+        }
+        for index in range(32)
+    ]
+
+    results = await download_video_assets(items, concurrency=4)
+
+    assert results == [f"task-{index}/download/video.mp4" for index in range(32)]
+    assert peak == 4
+
+
+@pytest.mark.asyncio
+async def test_http_client_session_closes_after_last_user(monkeypatch):
+    class DummyClient:
+        def __init__(self, **kwargs):
+            self.closed = False
+
+        async def aclose(self):
+            self.closed = True
+
+    monkeypatch.setattr("stevedore.tasks.downloads.httpx.AsyncClient", DummyClient)
+
+    async with http_client_session() as first:
+        async with http_client_session() as second:
+            assert second is first
+        assert not first.closed
+        assert downloads._get_http_client() is first
+    assert first.closed
+
+    async with http_client_session() as fresh:
+        assert fresh is not first
+
+
+@pytest.mark.asyncio
+async def test_download_video_asset_coalesces_concurrent_calls(monkeypatch):
+    calls = []
+
+    async def fake_download(**kwargs):
+        calls.append(kwargs["task_id"])
+        await asyncio.sleep(0.01)
+        return f"{kwargs['task_id']}/download/video.mp4"
+
+    monkeypatch.setattr("stevedore.tasks.downloads._download_video_asset", fake_download)
+
+    def call(task_id):
+        return download_video_asset.fn(
+            source_url="http://example.com/video",
+            task_id=task_id,
+            cobalt_settings_block="cobalt",
+            minio_bucket_block="minio",
+            object_name="video.mp4",
+        )
+
+    results = await asyncio.gather(*(call("task-123") for _ in range(10)), call("task-456"))
+
+    assert results == ["task-123/download/video.mp4"] * 10 + ["task-456/download/video.mp4"]
+    assert sorted(calls) == ["task-123", "task-456"]
+    assert not downloads._INFLIGHT.get(asyncio.get_running_loop())
+
+
+@pytest.mark.asyncio
+async def test_download_video_asset_cancels_shared_run_only_with_last_caller(monkeypatch):
+    release = asyncio.Event()
+    started = []
+    cancelled = []
+
+    async def fake_download(**kwargs):
+        started.append(kwargs["task_id"])
+        try:
+            await release.wait()
+        except asyncio.CancelledError:
+            cancelled.append(kwargs["task_id"])
+            raise
+        return f"{kwargs['task_id']}/download/video.mp4"
+
+    monkeypatch.setattr("stevedore.tasks.downloads._download_video_asset", fake_download)
+
+    def call(task_id):
+        return asyncio.ensure_future(
+            download_video_asset.fn(
+                source_url="http://example.com/video",
+                task_id=task_id,
+                cobalt_settings_block="cobalt",
+                minio_bucket_block="minio",
+                object_name="video.mp4",
+            )
+        )
+
+    leader, follower = call("task-123"), call("task-123")
+    await asyncio.sleep(0)
+    leader.cancel()
+    await asyncio.gather(leader, return_exceptions=True)
+
+    # The follower still receives the result of the run the leader started.
+    release.set()
+    assert await follower == "task-123/download/video.mp4"
+    assert leader.cancelled()
+    assert started == ["task-123"]
+    assert not cancelled
+
+    release.clear()
+    first, second = call("task-456"), call("task-456")
+    await asyncio.sleep(0)
+    first.cancel()
+    second.cancel()
+    await asyncio.gather(first, second, return_exceptions=True)
+    await asyncio.sleep(0)
+
+    assert cancelled == ["task-456"]
+    assert not downloads._INFLIGHT.get(asyncio.get_running_loop())
+
+
+@pytest.mark.asyncio
+async def test_run_ffprobe_kills_the_process_when_cancelled(monkeypatch, tmp_path):
+    class HangingProcess:
+        returncode = None
+        killed = False
+
+        async def communicate(self):
+            await asyncio.Event().wait()
+
+        def kill(self):
+            self.killed = True
+            self.returncode = -9
+
+        async def wait(self):
+            return self.returncode
+
+    process = HangingProcess()
+    monkeypatch.setattr(
+        "stevedore.tasks.downloads.asyncio.create_subprocess_exec",
+        AsyncMock(return_value=process),
+    )
+    video = tmp_path / "video.mp4"
+    video.write_bytes(b"video")
+
+    probe = asyncio.ensure_future(downloads._run_ffprobe(video))
+    await asyncio.sleep(0)
+    probe.cancel()
+
+    with pytest.raises(asyncio.CancelledError):
+        await probe
+    assert process.killed
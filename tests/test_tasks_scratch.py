@@ -0,0 +1,27 @@
+"""Tests for scratch-space selection."""
+
+from __future__ import annotations
+
+from types import SimpleNamespace
+
+from stevedore.tasks import scratch
+
+
+def test_scratch_root_prefers_override(monkeypatch):
+    monkeypatch.setattr(scratch, "_TMP_ROOT", "/override")
+
+    assert scratch.scratch_root(None) == "/override"
+
+
+def test_scratch_root_uses_tmpfs_only_when_it_fits(monkeypatch, tmp_path):
+    monkeypatch.setattr(scratch, "_TMP_ROOT", None)
+    monkeypatch.setattr(scratch, "_SHM_ROOT", str(tmp_path))
+    monkeypatch.setattr(
+        scratch.shutil,
+        "disk_usage",
+        lambda path: SimpleNamespace(free=100),
+    )
+
+    assert scratch.scratch_root(40) == str(tmp_path)
+    assert scratch.scratch_root(60) is None
+    assert scratch.scratch_root(None) is None